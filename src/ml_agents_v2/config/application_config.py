@@ -83,6 +83,11 @@ class ApplicationConfig(BaseSettings):
     max_concurrent_evaluations: int = Field(
         default=1, description="Maximum concurrent evaluation executions"
     )
+    max_concurrent_questions: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum questions executed concurrently per evaluation",
+    )
     question_timeout_seconds: int = Field(
         default=30, description="Timeout for individual question processing"
     )
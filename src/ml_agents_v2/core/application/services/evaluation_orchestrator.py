@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from collections.abc import Callable
 from datetime import datetime
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
 from ...domain.value_objects.answer import Answer
 from ...domain.value_objects.evaluation_results import EvaluationResults
 from ...domain.value_objects.failure_reason import FailureReason
+from ...domain.value_objects.question import Question
 from ..dto.evaluation_info import EvaluationInfo
 from ..dto.evaluation_summary import EvaluationSummary
 from ..dto.progress_info import ProgressInfo
@@ -60,6 +62,7 @@ class EvaluationOrchestrator:
         reasoning_infrastructure_service: ReasoningInfrastructureService,
         domain_service_registry: dict[str, ReasoningAgentService],
         export_service: ExportService,
+        max_concurrent_questions: int = 1,
     ) -> None:
         """Initialize the evaluation orchestrator.
 
@@ -70,6 +73,7 @@ class EvaluationOrchestrator:
             reasoning_infrastructure_service: Infrastructure service for LLM calls
             domain_service_registry: Registry of domain reasoning services
             export_service: Service for exporting evaluation results
+            max_concurrent_questions: Maximum questions executed concurrently
         """
         self._evaluation_repo = evaluation_repository
         self._question_result_repo = evaluation_question_result_repository
@@ -77,6 +81,7 @@ class EvaluationOrchestrator:
         self._reasoning_infrastructure = reasoning_infrastructure_service
         self._domain_services = domain_service_registry
         self._export_service = export_service
+        self._max_concurrent_questions = max_concurrent_questions
         self._logger = structlog.get_logger(__name__)
 
     def create_evaluation(
@@ -569,122 +574,163 @@ class EvaluationOrchestrator:
         questions = benchmark.get_questions()
         total_questions = len(questions)
 
-        for _i, question in enumerate(questions):
-            # Check if already completed (for resume capability)
+        # Check which questions are already completed (for resume capability)
+        pending_questions = []
+        for question in questions:
             if self._question_result_repo.exists(evaluation.evaluation_id, question.id):
                 self._logger.debug(f"Skipping already completed question {question.id}")
                 continue
-
-            try:
-                from datetime import datetime as dt
-
-                start_time = dt.now()
-
-                # Execute reasoning using infrastructure service
-                result = await self._reasoning_infrastructure.execute_reasoning(
-                    domain_service, question, evaluation.agent_config
+            pending_questions.append(question)
+
+        # LLM calls are network-bound, so dispatch questions concurrently up to
+        # the configured limit (a limit of 1 keeps sequential execution)
+        semaphore = asyncio.Semaphore(self._max_concurrent_questions)
+
+        async def execute_bounded(question: Question) -> None:
+            async with semaphore:
+                await self._execute_single_question(
+                    evaluation,
+                    domain_service,
+                    question,
+                    total_questions,
+                    progress_callback,
                 )
 
-                execution_time = (dt.now() - start_time).total_seconds()
-
-                if isinstance(result, Answer):
-                    # Check if answer is correct
-                    is_correct = (
-                        result.extracted_answer.strip().lower()
-                        == question.expected_answer.strip().lower()
-                    )
-
-                    # Create successful question result
-                    question_result = EvaluationQuestionResult.create_successful(
-                        evaluation_id=evaluation.evaluation_id,
-                        question_id=question.id,
-                        question_text=question.text,
-                        expected_answer=question.expected_answer,
-                        actual_answer=result.extracted_answer,
-                        is_correct=is_correct,
-                        execution_time=execution_time,
-                        reasoning_trace=result.reasoning_trace,
-                    )
+        tasks = [
+            asyncio.ensure_future(execute_bounded(question))
+            for question in pending_questions
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop outstanding questions so failures and interrupts propagate,
+            # and let them unwind before the error reaches the caller
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _execute_single_question(
+        self,
+        evaluation: Evaluation,
+        domain_service: ReasoningAgentService,
+        question: Question,
+        total_questions: int,
+        progress_callback: Callable[[ProgressInfo], None] | None,
+    ) -> None:
+        """Execute one question and persist its result immediately.
 
-                else:  # FailureReason
-                    # Log failure with technical details for debugging
-                    self._logger.warning(
-                        "Question processing failed",
-                        question_id=question.id,
-                        error_category=result.category,
-                        error_description=result.description,
-                        technical_details=result.technical_details,
-                        recoverable=result.recoverable,
-                    )
+        Args:
+            evaluation: The evaluation being executed
+            domain_service: Domain reasoning service for the agent type
+            question: The question to process
+            total_questions: Number of questions in the benchmark
+            progress_callback: Optional progress callback
+        """
+        try:
+            start_time = datetime.now()
 
-                    # Create failed question result
-                    question_result = EvaluationQuestionResult.create_failed(
-                        evaluation_id=evaluation.evaluation_id,
-                        question_id=question.id,
-                        question_text=question.text,
-                        expected_answer=question.expected_answer,
-                        error_message=result.description,
-                        execution_time=execution_time,
-                        technical_details=result.technical_details,
-                    )
+            # Execute reasoning using infrastructure service
+            result = await self._reasoning_infrastructure.execute_reasoning(
+                domain_service, question, evaluation.agent_config
+            )
 
-                # Save immediately (incremental persistence)
-                self._question_result_repo.save(question_result)
+            execution_time = (datetime.now() - start_time).total_seconds()
 
-                # Update progress using real saved data
-                if progress_callback:
-                    domain_progress = self._question_result_repo.get_progress(
-                        evaluation.evaluation_id, total_questions
-                    )
-                    # Convert to application DTO
-                    # Parse latest_processed_at if it's a string, fallback to created_at
-                    from datetime import datetime
+            if isinstance(result, Answer):
+                # Check if answer is correct
+                is_correct = (
+                    result.extracted_answer.strip().lower()
+                    == question.expected_answer.strip().lower()
+                )
 
-                    from ..dto.progress_info import ProgressInfo
-
-                    last_updated = evaluation.created_at
-                    if domain_progress.latest_processed_at:
-                        try:
-                            last_updated = datetime.fromisoformat(
-                                domain_progress.latest_processed_at
-                            )
-                        except ValueError:
-                            last_updated = evaluation.created_at
-
-                    progress_info = ProgressInfo(
-                        evaluation_id=domain_progress.evaluation_id,
-                        current_question=domain_progress.completed_questions,
-                        total_questions=domain_progress.total_questions,
-                        successful_answers=domain_progress.successful_questions,
-                        failed_questions=domain_progress.failed_questions,
-                        started_at=evaluation.started_at or evaluation.created_at,
-                        last_updated=last_updated,
-                    )
-                    progress_callback(progress_info)
+                # Create successful question result
+                question_result = EvaluationQuestionResult.create_successful(
+                    evaluation_id=evaluation.evaluation_id,
+                    question_id=question.id,
+                    question_text=question.text,
+                    expected_answer=question.expected_answer,
+                    actual_answer=result.extracted_answer,
+                    is_correct=is_correct,
+                    execution_time=execution_time,
+                    reasoning_trace=result.reasoning_trace,
+                )
 
-            except Exception as e:
-                # Handle unexpected errors during question processing
-                self._logger.error(
-                    "Question execution failed",
-                    extra={
-                        "question_id": question.id,
-                        "error": str(e),
-                        "technical_details": f"{type(e).__name__}: {str(e)}",
-                    },
+            else:  # FailureReason
+                # Log failure with technical details for debugging
+                self._logger.warning(
+                    "Question processing failed",
+                    question_id=question.id,
+                    error_category=result.category,
+                    error_description=result.description,
+                    technical_details=result.technical_details,
+                    recoverable=result.recoverable,
                 )
 
-                # Save failed question result
-                execution_time = (dt.now() - start_time).total_seconds()
-                failed_question_result = EvaluationQuestionResult.create_failed(
+                # Create failed question result
+                question_result = EvaluationQuestionResult.create_failed(
                     evaluation_id=evaluation.evaluation_id,
                     question_id=question.id,
                     question_text=question.text,
                     expected_answer=question.expected_answer,
-                    error_message=f"Unexpected error: {str(e)}",
+                    error_message=result.description,
                     execution_time=execution_time,
-                    technical_details=f"{type(e).__name__}: {str(e)}",
+                    technical_details=result.technical_details,
                 )
-                self._question_result_repo.save(failed_question_result)
+
+            # Save immediately (incremental persistence)
+            self._question_result_repo.save(question_result)
+
+            # Update progress using real saved data
+            if progress_callback:
+                domain_progress = self._question_result_repo.get_progress(
+                    evaluation.evaluation_id, total_questions
+                )
+                # Convert to application DTO
+                # Parse latest_processed_at if it's a string, fallback to created_at
+                last_updated = evaluation.created_at
+                if domain_progress.latest_processed_at:
+                    try:
+                        last_updated = datetime.fromisoformat(
+                            domain_progress.latest_processed_at
+                        )
+                    except ValueError:
+                        last_updated = evaluation.created_at
+
+                progress_info = ProgressInfo(
+                    evaluation_id=domain_progress.evaluation_id,
+                    current_question=domain_progress.completed_questions,
+                    total_questions=domain_progress.total_questions,
+                    successful_answers=domain_progress.successful_questions,
+                    failed_questions=domain_progress.failed_questions,
+                    started_at=evaluation.started_at or evaluation.created_at,
+                    last_updated=last_updated,
+                )
+                progress_callback(progress_info)
+
+        except Exception as e:
+            # Handle unexpected errors during question processing
+            self._logger.error(
+                "Question execution failed",
+                extra={
+                    "question_id": question.id,
+                    "error": str(e),
+                    "technical_details": f"{type(e).__name__}: {str(e)}",
+                },
+            )
+
+            # Save failed question result
+            execution_time = (datetime.now() - start_time).total_seconds()
+            failed_question_result = EvaluationQuestionResult.create_failed(
+                evaluation_id=evaluation.evaluation_id,
+                question_id=question.id,
+                question_text=question.text,
+                expected_answer=question.expected_answer,
+                error_message=f"Unexpected error: {str(e)}",
+                execution_time=execution_time,
+                technical_details=f"{type(e).__name__}: {str(e)}",
+            )
+            self._question_result_repo.save(failed_question_result)
 
     def _validate_agent_config(self, agent_config: AgentConfig) -> ValidationResult:
         """Validate agent configuration.
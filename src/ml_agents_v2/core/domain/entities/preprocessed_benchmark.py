@@ -11,7 +11,7 @@ from typing import Any
 from ..value_objects.question import Question
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreprocessedBenchmark:
     """Ready-to-evaluate dataset with standardized format.
 
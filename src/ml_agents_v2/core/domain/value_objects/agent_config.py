@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from .validation_result import ValidationResult
@@ -36,6 +37,11 @@ class AgentConfig:
             self, "agent_parameters", MappingProxyType(dict(self.agent_parameters))
         )
 
+    @cached_property
+    def qualified_model_name(self) -> str:
+        """Provider-qualified model identifier (e.g. "openrouter/gpt-4")."""
+        return f"{self.model_provider}/{self.model_name}"
+
     def equals(self, other: object) -> bool:
         """Value-based equality comparison."""
         if not isinstance(other, AgentConfig):
@@ -153,22 +153,27 @@ class EvaluationResults:
                 summary_statistics={},
             )
 
-        # Count correct answers (only successful questions can be correct)
-        correct_answers = sum(1 for q in question_results if q.is_correct is True)
+        # Aggregate counts, timing and legacy results in a single pass
+        correct_answers = 0
+        error_count = 0
+        total_execution_time = 0.0
+        detailed_results = []
+        for q in question_results:
+            # Only successful questions can be correct
+            if q.is_correct is True:
+                correct_answers += 1
+            # Errors are questions with error messages
+            if q.error_message is not None:
+                error_count += 1
+            total_execution_time += q.execution_time
+            # Convert to legacy QuestionResult format for compatibility
+            detailed_results.append(q.to_question_result())
 
-        # Count errors (questions with error messages)
-        error_count = sum(1 for q in question_results if q.error_message is not None)
-
-        # Calculate average execution time
-        total_execution_time = sum(q.execution_time for q in question_results)
         average_execution_time = total_execution_time / total_questions
 
         # Calculate accuracy
         accuracy = (correct_answers / total_questions) * 100.0
 
-        # Convert to legacy QuestionResult format for compatibility
-        detailed_results = [q.to_question_result() for q in question_results]
-
         # Generate summary statistics
         successful_questions = total_questions - error_count
         summary_statistics = {
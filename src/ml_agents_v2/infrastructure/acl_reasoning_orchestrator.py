@@ -51,7 +51,7 @@ class ReasoningInfrastructureService:
             # Infrastructure: Execute with structured output parsing
             start_time = time.time()
             response = await llm_client.chat_completion(
-                model=f"{config.model_provider}/{config.model_name}",
+                model=config.qualified_model_name,
                 messages=[{"role": "user", "content": prompt}],
                 _internal_agent_type=config.agent_type,  # For Marvin strategy
                 **config.model_parameters,
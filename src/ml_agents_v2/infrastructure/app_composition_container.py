@@ -160,6 +160,7 @@ class Container(containers.DeclarativeContainer):
         reasoning_infrastructure_service=reasoning_infrastructure_service,
         domain_service_registry=domain_service_registry,
         export_service=export_service,
+        max_concurrent_questions=config.provided.max_concurrent_questions,
     )
 
     benchmark_processor = providers.Factory(
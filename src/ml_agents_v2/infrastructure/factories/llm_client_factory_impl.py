@@ -21,6 +21,7 @@ from ..providers import (
     OpenAIClient,
     OpenRouterClient,
 )
+from .model_capabilities import ModelCapabilitiesRegistry
 
 
 class LLMClientFactoryImpl(LLMClientFactory):
@@ -54,6 +55,10 @@ class LLMClientFactoryImpl(LLMClientFactory):
         self.default_parsing_strategy = default_parsing_strategy
         self._logger = structlog.get_logger(__name__)
 
+        # Wrapped clients hold only a base client reference, so one instance
+        # per (model, provider, strategy) can be reused across questions
+        self._client_cache: dict[tuple[str, str | None, str], LLMClient] = {}
+
     def create_client(
         self,
         model_name: str,
@@ -62,6 +67,9 @@ class LLMClientFactoryImpl(LLMClientFactory):
     ) -> LLMClient:
         """Create appropriate LLM client for model and strategy combination.
 
+        Clients are memoized per (model_name, provider, strategy) so repeated
+        calls during an evaluation reuse the same client and connection pool.
+
         Args:
             model_name: Model identifier (e.g., "gpt-4", "claude-3-sonnet")
             provider: LLM provider or None for auto-detection from model name
@@ -74,6 +82,11 @@ class LLMClientFactoryImpl(LLMClientFactory):
             UnsupportedProviderError: If provider is not supported or configured
             UnsupportedStrategyError: If strategy is not compatible with model
         """
+        cache_key = (model_name, provider, strategy)
+        cached_client = self._client_cache.get(cache_key)
+        if cached_client is not None:
+            return cached_client
+
         # Step 1: Auto-detect provider from model name if not specified
         if provider is None:
             provider = self._detect_provider(model_name)
@@ -100,7 +113,9 @@ class LLMClientFactoryImpl(LLMClientFactory):
         )
 
         # Step 4: Wrap with parsing strategy
-        return self._wrap_with_parser(base_client, strategy, model_name)
+        client = self._wrap_with_parser(base_client, strategy, model_name)
+        self._client_cache[cache_key] = client
+        return client
 
     def _detect_provider(self, model_name: str) -> str:
         """Auto-detect provider from model name prefix.
@@ -212,25 +227,16 @@ class LLMClientFactoryImpl(LLMClientFactory):
         Returns:
             Strategy name (marvin, outlines, native)
         """
-        # OpenAI models support native structured output
-        if provider == "openai" and model_name.startswith(("gpt-4", "gpt-3.5-turbo")):
+        # Models with server-side json_schema support get native structured
+        # output, which avoids a second extraction pass over the response
+        supports_json_schema = (
+            ModelCapabilitiesRegistry.supports_json_schema_response_format(model_name)
+        )
+        if provider in ("openai", "openrouter") and supports_json_schema:
             return "native"
 
-        # Anthropic models work well with Marvin post-processing
-        elif provider == "anthropic":
-            return "marvin"
-
-        # OpenRouter can use different strategies based on model
-        elif provider == "openrouter":
-            # If model supports structured output, use native
-            if "gpt-4" in model_name or "gpt-3.5" in model_name:
-                return "native"
-            # Otherwise use Marvin
-            return "marvin"
-
-        # LiteLLM and others: default to Marvin
-        else:
-            return "marvin"
+        # Anthropic, LiteLLM and other models: Marvin post-processing
+        return "marvin"
 
     def _wrap_with_parser(
         self, base_client: LLMClient, strategy: str, model_name: str
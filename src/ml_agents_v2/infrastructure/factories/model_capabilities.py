@@ -4,23 +4,37 @@ This module determines which structured output approach to use based on
 model capabilities.
 """
 
+from functools import lru_cache
+
 
 class ModelCapabilitiesRegistry:
     """Registry for determining model capabilities."""
 
     # Models that support logprobs (OpenAI models)
-    LOGPROBS_MODELS = {
-        "gpt-4",
-        "gpt-4-turbo",
-        "gpt-4o",
-        "gpt-4o-mini",
-        "gpt-3.5-turbo",
-        "o1",
-        "o1-mini",
-        "o1-preview",
-    }
+    LOGPROBS_MODELS = frozenset(
+        {
+            "gpt-4",
+            "gpt-4-turbo",
+            "gpt-4o",
+            "gpt-4o-mini",
+            "gpt-3.5-turbo",
+            "o1",
+            "o1-mini",
+            "o1-preview",
+        }
+    )
+
+    # Models that accept response_format={"type": "json_schema", ...}
+    JSON_SCHEMA_MODELS = frozenset({"gpt-4", "gpt-3.5-turbo"})
 
+    @staticmethod
+    def _base_model_name(model_name: str) -> str:
+        """Strip any provider prefix (e.g. "openai/gpt-4") from a model name."""
+        return model_name.split("/")[-1] if "/" in model_name else model_name
+
+    # Lookups are memoized: an evaluation queries the same few models repeatedly
     @classmethod
+    @lru_cache(maxsize=256)
     def supports_logprobs(cls, model_name: str) -> bool:
         """Check if a model supports logprobs.
 
@@ -30,10 +44,26 @@ class ModelCapabilitiesRegistry:
         Returns:
             True if the model supports logprobs, False otherwise
         """
-        # Extract base model name (remove provider prefix if present)
-        base_model = model_name.split("/")[-1] if "/" in model_name else model_name
+        base_model = cls._base_model_name(model_name)
 
         # Check if base model supports logprobs
         return any(
             logprobs_model in base_model for logprobs_model in cls.LOGPROBS_MODELS
         )
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def supports_json_schema_response_format(cls, model_name: str) -> bool:
+        """Check if a model supports native json_schema structured output.
+
+        Args:
+            model_name: Name of the model to check
+
+        Returns:
+            True if the model accepts a json_schema response_format
+        """
+        base_model = cls._base_model_name(model_name)
+
+        return any(
+            schema_model in base_model for schema_model in cls.JSON_SCHEMA_MODELS
+        )
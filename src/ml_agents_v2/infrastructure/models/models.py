@@ -1,17 +1,73 @@
 """Infrastructure output models for structured parsing."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of a JSON-like value."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a plain dict/list copy of a value built by _freeze."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
 class BaseReasoningOutput(BaseModel):
-    """Base class for all reasoning approach output models."""
+    """Base class for all reasoning approach output models.
+
+    Output models are fixed at code time, so each subclass computes its JSON
+    schema and json_schema response_format once, when the class is created.
+    Both are stored read-only because every request for an agent type shares
+    them; response_format() hands each request its own mutable copy.
+    """
 
     model_config = ConfigDict(
         json_schema_extra={"required": ["answer"], "additionalProperties": False}
     )
 
+    JSON_SCHEMA: ClassVar[Mapping[str, Any]]
+    RESPONSE_FORMAT: ClassVar[Mapping[str, Any]]
+
     answer: str = Field(description="Final answer from reasoning process")
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Register the schema and response_format of each output model."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.JSON_SCHEMA = _freeze(cls.model_json_schema())
+        cls.RESPONSE_FORMAT = MappingProxyType(
+            {
+                "type": "json_schema",
+                "json_schema": MappingProxyType(
+                    {
+                        "name": cls.__name__.lower(),
+                        "description": cls.__doc__ or f"Schema for {cls.__name__}",
+                        "schema": cls.JSON_SCHEMA,
+                        "strict": True,
+                    }
+                ),
+            }
+        )
+
+    @classmethod
+    def response_format(cls) -> dict[str, Any]:
+        """Return a fresh json_schema response_format for one request."""
+        response_format: dict[str, Any] = _thaw(cls.RESPONSE_FORMAT)
+        return response_format
+
 
 class DirectAnswerOutput(BaseReasoningOutput):
     """Infrastructure model for None agent structured output."""
@@ -23,3 +79,10 @@ class ChainOfThoughtOutput(BaseReasoningOutput):
     """Infrastructure model for Chain of Thought structured output."""
 
     reasoning: str = Field(description="Step-by-step reasoning process")
+
+
+# Static mapping from domain agent type to infrastructure output schema
+AGENT_OUTPUT_SCHEMAS: dict[str, type[BaseReasoningOutput]] = {
+    "none": DirectAnswerOutput,
+    "chain_of_thought": ChainOfThoughtOutput,
+}
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 
 from ....core.domain.services.llm_client import LLMClient
 from ....core.domain.value_objects.answer import ParsedResponse
+from ...models.models import AGENT_OUTPUT_SCHEMAS, DirectAnswerOutput
 
 
 class MarvinParsingClient(LLMClient):
@@ -52,13 +53,7 @@ class MarvinParsingClient(LLMClient):
         Returns:
             Infrastructure Pydantic model for structured output
         """
-        from ...models.models import ChainOfThoughtOutput, DirectAnswerOutput
-
-        mapping: dict[str, type[BaseModel]] = {
-            "none": DirectAnswerOutput,
-            "chain_of_thought": ChainOfThoughtOutput,
-        }
-        return mapping.get(agent_type or "none", DirectAnswerOutput)
+        return AGENT_OUTPUT_SCHEMAS.get(agent_type or "none", DirectAnswerOutput)
 
     async def chat_completion(
         self, model: str, messages: list[dict[str, str]], **kwargs: Any
@@ -7,10 +7,14 @@ This parsing client uses the provider's native structured output capabilities
 from typing import Any
 
 import structlog
-from pydantic import BaseModel
 
 from ....core.domain.services.llm_client import LLMClient
 from ....core.domain.value_objects.answer import ParsedResponse
+from ...models.models import (
+    AGENT_OUTPUT_SCHEMAS,
+    BaseReasoningOutput,
+    DirectAnswerOutput,
+)
 
 
 class NativeParsingClient(LLMClient):
@@ -30,7 +34,9 @@ class NativeParsingClient(LLMClient):
         self.base_client = base_client
         self._logger = structlog.get_logger(__name__)
 
-    def _get_schema_for_agent(self, agent_type: str | None) -> type[BaseModel]:
+    def _get_schema_for_agent(
+        self, agent_type: str | None
+    ) -> type[BaseReasoningOutput]:
         """Map domain agent type to infrastructure Pydantic schema.
 
         Args:
@@ -39,33 +45,20 @@ class NativeParsingClient(LLMClient):
         Returns:
             Infrastructure Pydantic model for structured output
         """
-        from ...models.models import ChainOfThoughtOutput, DirectAnswerOutput
+        return AGENT_OUTPUT_SCHEMAS.get(agent_type or "none", DirectAnswerOutput)
 
-        mapping: dict[str, type[BaseModel]] = {
-            "none": DirectAnswerOutput,
-            "chain_of_thought": ChainOfThoughtOutput,
-        }
-        return mapping.get(agent_type or "none", DirectAnswerOutput)
-
-    def _create_response_format(self, schema: type[BaseModel]) -> dict[str, Any]:
+    def _create_response_format(
+        self, schema: type[BaseReasoningOutput]
+    ) -> dict[str, Any]:
         """Create OpenAI-style response_format from Pydantic model.
 
         Args:
-            schema: Pydantic model class
+            schema: Infrastructure output model class
 
         Returns:
             Dictionary with response_format for native structured output
         """
-        json_schema = schema.model_json_schema()
-        return {
-            "type": "json_schema",
-            "json_schema": {
-                "name": schema.__name__.lower(),
-                "description": schema.__doc__ or f"Schema for {schema.__name__}",
-                "schema": json_schema,
-                "strict": True,
-            },
-        }
+        return schema.response_format()
 
     async def chat_completion(
         self, model: str, messages: list[dict[str, str]], **kwargs: Any
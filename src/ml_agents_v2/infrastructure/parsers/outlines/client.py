@@ -8,10 +8,15 @@ true Outlines constrained generation for local models.
 from typing import Any
 
 import structlog
-from pydantic import BaseModel
+from pydantic import ValidationError
 
 from ....core.domain.services.llm_client import LLMClient
 from ....core.domain.value_objects.answer import ParsedResponse
+from ...models.models import (
+    AGENT_OUTPUT_SCHEMAS,
+    BaseReasoningOutput,
+    DirectAnswerOutput,
+)
 
 
 class OutlinesParsingClient(LLMClient):
@@ -31,7 +36,9 @@ class OutlinesParsingClient(LLMClient):
         self.base_client = base_client
         self._logger = structlog.get_logger(__name__)
 
-    def _get_schema_for_agent(self, agent_type: str | None) -> type[BaseModel]:
+    def _get_schema_for_agent(
+        self, agent_type: str | None
+    ) -> type[BaseReasoningOutput]:
         """Map domain agent type to infrastructure Pydantic schema.
 
         Args:
@@ -40,33 +47,20 @@ class OutlinesParsingClient(LLMClient):
         Returns:
             Infrastructure Pydantic model for structured output
         """
-        from ...models.models import ChainOfThoughtOutput, DirectAnswerOutput
+        return AGENT_OUTPUT_SCHEMAS.get(agent_type or "none", DirectAnswerOutput)
 
-        mapping: dict[str, type[BaseModel]] = {
-            "none": DirectAnswerOutput,
-            "chain_of_thought": ChainOfThoughtOutput,
-        }
-        return mapping.get(agent_type or "none", DirectAnswerOutput)
-
-    def _create_response_format(self, schema: type[BaseModel]) -> dict[str, Any]:
+    def _create_response_format(
+        self, schema: type[BaseReasoningOutput]
+    ) -> dict[str, Any]:
         """Create response_format for constrained generation.
 
         Args:
-            schema: Pydantic model class
+            schema: Infrastructure output model class
 
         Returns:
             Dictionary with response_format specification
         """
-        json_schema = schema.model_json_schema()
-        return {
-            "type": "json_schema",
-            "json_schema": {
-                "name": schema.__name__.lower(),
-                "description": schema.__doc__ or f"Schema for {schema.__name__}",
-                "schema": json_schema,
-                "strict": True,
-            },
-        }
+        return schema.response_format()
 
     async def chat_completion(
         self, model: str, messages: list[dict[str, str]], **kwargs: Any
@@ -112,16 +106,15 @@ class OutlinesParsingClient(LLMClient):
                     agent_type=agent_type,
                 )
                 # If no structured data, try to parse from content
-                import json
-
                 try:
-                    parsed_json = json.loads(response.content)
-                    validated = schema.model_validate(parsed_json)
+                    # Single pydantic-core pass: parse and validate the JSON
+                    # without building an intermediate dict
+                    validated = schema.model_validate_json(response.content)
                     structured_data = validated.model_dump()
                     return ParsedResponse(
                         content=response.content, structured_data=structured_data
                     )
-                except (json.JSONDecodeError, Exception) as e:
+                except ValidationError as e:
                     self._logger.error(
                         "Failed to parse structured data from content", error=str(e)
                     )
@@ -7,6 +7,8 @@ all external API types are normalized to consistent domain types.
 ALL type normalization happens here and ONLY here.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import structlog
@@ -15,6 +17,15 @@ from openai import AsyncOpenAI
 from ....core.domain.services.llm_client import LLMClient
 from ....core.domain.value_objects.answer import ParsedResponse
 
+# OpenRouter attribution headers, identical for every request. Read-only;
+# each request passes its own copy to the SDK
+OPENROUTER_ATTRIBUTION_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        "HTTP-Referer": "https://github.com/c4ai/ml-agents-v2",
+        "X-Title": "ML-Agents-v2",
+    }
+)
+
 
 class OpenRouterClient(LLMClient):
     """Anti-Corruption Layer for OpenRouter API.
@@ -97,12 +108,6 @@ class OpenRouterClient(LLMClient):
         This method uses the AsyncOpenAI client to communicate with OpenRouter.
         It returns the raw OpenAI response object that gets normalized by _translate_to_domain.
         """
-        # Prepare extra headers for OpenRouter attribution
-        extra_headers = {
-            "HTTP-Referer": "https://github.com/c4ai/ml-agents-v2",
-            "X-Title": "ML-Agents-v2",
-        }
-
         # Build request parameters with defaults
         request_params = {
             "model": model,
@@ -111,7 +116,7 @@ class OpenRouterClient(LLMClient):
             "top_p": kwargs.get("top_p", 1.0),
             "frequency_penalty": kwargs.get("frequency_penalty", 0.0),
             "presence_penalty": kwargs.get("presence_penalty", 0.0),
-            "extra_headers": extra_headers,
+            "extra_headers": dict(OPENROUTER_ATTRIBUTION_HEADERS),
         }
 
         # Add optional parameters if provided
@@ -218,10 +223,7 @@ class OpenRouterClient(LLMClient):
                 model="openai/gpt-3.5-turbo",  # Use a reliable, cheap model for health check
                 messages=[{"role": "user", "content": "ping"}],
                 max_tokens=1,
-                extra_headers={
-                    "HTTP-Referer": "https://github.com/c4ai/ml-agents-v2",
-                    "X-Title": "ML-Agents-v2",
-                },
+                extra_headers=dict(OPENROUTER_ATTRIBUTION_HEADERS),
             )
 
             # If we get here, the API is responding
@@ -12,10 +12,10 @@ class ParserException(Exception):
 
     def __init__(
         self,
-        parser_type: str,  # "InstructorParser" | "StructuredLogProbsParser"
+        parser_type: str,  # Parsing strategy: "marvin" | "outlines" | "native" | "auto"
         model: str,
         provider: str,
-        stage: str,  # "json_parse" | "schema_validation" | "response_empty"
+        stage: str,  # e.g. "structured_data_extraction"
         content: str,
         error: Exception,
     ):
@@ -0,0 +1,49 @@
+"""Infrastructure BDD test fixtures.
+
+These override the chain-of-thought defaults from the parent conftest with
+a direct-answer (``none``) setup matching NoneAgentService.
+"""
+
+import pytest
+
+from ml_agents_v2.core.domain.services.reasoning.none_agent_service import (
+    NoneAgentService,
+)
+from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
+from ml_agents_v2.core.domain.value_objects.question import Question
+from ml_agents_v2.infrastructure.providers import OpenRouterErrorMapper
+
+
+@pytest.fixture(scope="module")
+def sample_question():
+    """Sample question for testing."""
+    return Question(
+        id="test_q1",
+        text="What is the capital of France?",
+        expected_answer="Paris",
+        metadata={},
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_agent_config():
+    """Sample agent configuration."""
+    return AgentConfig(
+        agent_type="none",
+        model_provider="anthropic",
+        model_name="claude-3-sonnet",
+        model_parameters={"temperature": 0.1},
+        agent_parameters={},
+    )
+
+
+@pytest.fixture(scope="module")
+def domain_service():
+    """Domain service for testing."""
+    return NoneAgentService()
+
+
+@pytest.fixture(scope="module")
+def error_mapper():
+    """Stateless OpenRouter error mapper shared by the module's tests."""
+    return OpenRouterErrorMapper()
@@ -9,229 +9,185 @@ This module implements proper BDD testing for structured output parsing:
 Key principle: Mock external boundaries (factory.create_client()), test internal logic.
 """
 
-import os
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
-from ml_agents_v2.config.application_config import get_config
-from ml_agents_v2.core.domain.services.llm_client import LLMClientFactory
-from ml_agents_v2.core.domain.services.reasoning.none_agent_service import (
-    NoneAgentService,
-)
+from ml_agents_v2.config.application_config import ApplicationConfig, get_config
+from ml_agents_v2.core.domain.services.llm_client import LLMClient, LLMClientFactory
 from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
-from ml_agents_v2.core.domain.value_objects.answer import (
-    Answer,
-    ParsedResponse,
-)
+from ml_agents_v2.core.domain.value_objects.answer import ParsedResponse
 from ml_agents_v2.core.domain.value_objects.failure_reason import FailureReason
-from ml_agents_v2.core.domain.value_objects.question import Question
 from ml_agents_v2.infrastructure.acl_reasoning_orchestrator import (
     ReasoningInfrastructureService,
 )
-from ml_agents_v2.infrastructure.providers import OpenRouterErrorMapper
 
+# The async tests share no loop-bound state, so one event loop serves them all
+_SHARED_LOOP = pytest.mark.asyncio(loop_scope="module")
 
-class TestParsingStrategySelection:
-    """BDD tests for PARSING_STRATEGY environment variable integration."""
-
-    @pytest.fixture
-    def sample_question(self):
-        """Sample question for testing."""
-        return Question(
-            id="test_q1",
-            text="What is the capital of France?",
-            expected_answer="Paris",
-            metadata={},
-        )
+# Frozen value objects, so every test can share the same instances
+_PARIS_JSON_RESPONSE = ParsedResponse(
+    content='{"answer": "Paris"}', structured_data={"answer": "Paris"}
+)
+_PARIS_TEXT_RESPONSE = ParsedResponse(
+    content="Paris", structured_data={"answer": "Paris"}
+)
+# Valid content but no structured_data, which triggers a parser error
+_UNSTRUCTURED_RESPONSE = ParsedResponse(
+    content="Some natural language response", structured_data=None
+)
 
-    @pytest.fixture
-    def sample_agent_config(self):
-        """Sample agent configuration."""
-        return AgentConfig(
-            agent_type="none",
-            model_provider="anthropic",
-            model_name="claude-3-sonnet",
-            model_parameters={"temperature": 0.1, "max_tokens": 100},
-            agent_parameters={},
-        )
+# Parsing strategies a ParserException description may name
+_PARSER_TOKENS = frozenset({"marvin", "outlines", "native", "auto"})
 
-    @pytest.fixture
-    def domain_service(self):
-        """Domain service for testing."""
-        return NoneAgentService()
 
-    async def test_outlines_strategy_uses_response_format(
-        self, sample_question, sample_agent_config, domain_service
-    ):
-        """Given PARSING_STRATEGY=outlines, when processing question, then uses response_format"""
-        # Arrange - Mock LLM client created by factory (AsyncMock for async methods)
-        mock_llm_client = AsyncMock()
-        mock_llm_client.chat_completion.return_value = ParsedResponse(
-            content='{"answer": "Paris"}', structured_data={"answer": "Paris"}
-        )
+@pytest.fixture(scope="session")
+def configs_by_strategy() -> dict[str, ApplicationConfig]:
+    """Application config loaded once for each PARSING_STRATEGY value."""
+    configs = {}
+    for strategy in ("outlines", "marvin", "auto"):
+        # The monkeypatch fixture is function-scoped, so use a context here
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("PARSING_STRATEGY", strategy)
+            configs[strategy] = get_config()
+    return configs
 
-        # Mock factory to return our mock client
-        mock_factory = Mock(spec=LLMClientFactory)
-        mock_factory.create_client.return_value = mock_llm_client
 
-        # Act - Test with outlines strategy
-        with patch.dict(os.environ, {"PARSING_STRATEGY": "outlines"}):
-            config = get_config()
-            service = ReasoningInfrastructureService(
-                llm_client_factory=mock_factory,
-                error_mapper=OpenRouterErrorMapper(),
-                parsing_strategy=config.parsing_strategy,
-            )
-
-            result = await service.execute_reasoning(
-                domain_service, sample_question, sample_agent_config
-            )
-
-        # Assert - Verify behavior
-        assert isinstance(result, Answer)
-        assert result.extracted_answer == "Paris"
+@pytest.fixture
+def mock_factory():
+    """LLMClientFactory mock; the external boundary these tests stub."""
+    return Mock(spec=LLMClientFactory)
 
-        # Verify factory was called with correct strategy and provider (Phase 9)
-        mock_factory.create_client.assert_called_once_with(
-            model_name=sample_agent_config.model_name,
-            provider=sample_agent_config.model_provider,
-            strategy="outlines",
-        )
 
-        # Verify LLM client was called (implementation details tested separately)
-        mock_llm_client.chat_completion.assert_called_once()
+@pytest.fixture
+def mock_llm_pair(mock_factory):
+    """Build a mocked (factory, client) pair whose client answers with response.
 
-    async def test_marvin_strategy_uses_internal_agent_type(
-        self, sample_question, sample_agent_config, domain_service
-    ):
-        """Given PARSING_STRATEGY=marvin, when processing question, then uses _internal_agent_type"""
-        # Arrange - Mock LLM client created by factory (AsyncMock for async methods)
-        mock_llm_client = AsyncMock()
-        mock_llm_client.chat_completion.return_value = ParsedResponse(
-            content="Paris", structured_data={"answer": "Paris"}
-        )
+    Pass an exception to have chat_completion raise it instead.
+    """
+
+    def build(response: ParsedResponse | Exception) -> tuple[Mock, Mock]:
+        # The spec makes the async chat_completion an AsyncMock already
+        mock_llm_client = Mock(spec=LLMClient)
+        if isinstance(response, Exception):
+            mock_llm_client.chat_completion.side_effect = response
+        else:
+            mock_llm_client.chat_completion.return_value = response
 
         # Mock factory to return our mock client
-        mock_factory = Mock(spec=LLMClientFactory)
         mock_factory.create_client.return_value = mock_llm_client
+        return mock_factory, mock_llm_client
 
-        # Act - Test with marvin strategy
-        with patch.dict(os.environ, {"PARSING_STRATEGY": "marvin"}):
-            config = get_config()
-            service = ReasoningInfrastructureService(
-                llm_client_factory=mock_factory,
-                error_mapper=OpenRouterErrorMapper(),
-                parsing_strategy=config.parsing_strategy,
-            )
-
-            result = await service.execute_reasoning(
-                domain_service, sample_question, sample_agent_config
-            )
-
-        # Assert - Verify behavior
-        assert isinstance(result, Answer)
-        assert result.extracted_answer == "Paris"
+    return build
 
-        # Verify factory was called with correct strategy and provider (Phase 9)
-        mock_factory.create_client.assert_called_once_with(
-            model_name=sample_agent_config.model_name,
-            provider=sample_agent_config.model_provider,
-            strategy="marvin",
-        )
-
-        # Verify LLM client was called (implementation details tested separately)
-        mock_llm_client.chat_completion.assert_called_once()
 
-    async def test_auto_strategy_selects_based_on_model_capabilities(
-        self, sample_question, domain_service
+@_SHARED_LOOP
+class TestParsingStrategySelection:
+    """BDD tests for parser client selection by parsing strategy."""
+
+    @pytest.mark.parametrize(
+        ("strategy", "response", "model_provider", "model_name", "expected_model"),
+        [
+            pytest.param(
+                "outlines",
+                _PARIS_JSON_RESPONSE,
+                "anthropic",
+                "claude-3-sonnet",
+                "anthropic/claude-3-sonnet",
+                id="outlines",
+            ),
+            pytest.param(
+                "marvin",
+                _PARIS_TEXT_RESPONSE,
+                "anthropic",
+                "claude-3-sonnet",
+                "anthropic/claude-3-sonnet",
+                id="marvin",
+            ),
+            # The factory is mocked, so "auto" is only forwarded here; the real
+            # factory resolves it to native because gpt-4 supports the
+            # json_schema response_format
+            pytest.param(
+                "auto",
+                _PARIS_JSON_RESPONSE,
+                "openai",
+                "gpt-4",
+                "openai/gpt-4",
+                id="auto",
+            ),
+        ],
+    )
+    async def test_strategy_uses_correct_client(
+        self,
+        sample_question,
+        domain_service,
+        error_mapper,
+        mock_llm_pair,
+        strategy,
+        response,
+        model_provider,
+        model_name,
+        expected_model,
     ):
-        """Given PARSING_STRATEGY=auto, when processing question, then selects parser based on model"""
-        # Arrange - Mock LLM client created by factory (AsyncMock for async methods)
-        mock_llm_client = AsyncMock()
-        mock_llm_client.chat_completion.return_value = ParsedResponse(
-            content='{"answer": "Paris"}', structured_data={"answer": "Paris"}
-        )
-
-        # Mock factory to return our mock client
-        mock_factory = Mock(spec=LLMClientFactory)
-        mock_factory.create_client.return_value = mock_llm_client
+        """Given PARSING_STRATEGY, when processing question, then factory builds client for that strategy"""
+        # Arrange - Mock LLM client created by factory
+        mock_factory, mock_llm_client = mock_llm_pair(response)
 
-        # Test with gpt-4 (supports logprobs) - should use StructuredLogProbsClient
-        gpt4_config = AgentConfig(
+        agent_config = AgentConfig(
             agent_type="none",
-            model_provider="openai",
-            model_name="gpt-4",
-            model_parameters={"temperature": 0.1},
+            model_provider=model_provider,
+            model_name=model_name,
+            model_parameters={"temperature": 0.1, "max_tokens": 100},
             agent_parameters={},
         )
 
-        with patch.dict(os.environ, {"PARSING_STRATEGY": "auto"}):
-            config = get_config()
-            service = ReasoningInfrastructureService(
-                llm_client_factory=mock_factory,
-                error_mapper=OpenRouterErrorMapper(),
-                parsing_strategy=config.parsing_strategy,
-            )
+        # Act - Environment loading is covered by TestConfigurationIntegration
+        service = ReasoningInfrastructureService(
+            llm_client_factory=mock_factory,
+            error_mapper=error_mapper,
+            parsing_strategy=strategy,
+        )
 
-            result = await service.execute_reasoning(
-                domain_service, sample_question, gpt4_config
-            )
+        result = await service.execute_reasoning(
+            domain_service, sample_question, agent_config
+        )
 
-        # Assert - Verify behavior and factory usage (Phase 9: includes provider)
-        assert isinstance(result, Answer)
+        # Assert - Verify behavior (a FailureReason has no extracted_answer)
+        assert result.extracted_answer == "Paris"
+
+        # Verify factory was called with correct strategy and provider (Phase 9)
         mock_factory.create_client.assert_called_once_with(
-            model_name="gpt-4", provider="openai", strategy="auto"
+            model_name=model_name, provider=model_provider, strategy=strategy
         )
 
         # Verify LLM client was called (implementation details tested separately)
         mock_llm_client.chat_completion.assert_called_once()
+        # Strategy-specific kwargs (response_format, logprobs) are added inside
+        # the factory-built client; the service always forwards the agent type
+        chat_kwargs = mock_llm_client.chat_completion.call_args.kwargs
+        assert chat_kwargs.get("model") == expected_model
+        assert chat_kwargs.get("_internal_agent_type") == "none"
 
 
+@_SHARED_LOOP
 class TestParserErrorTranslation:
     """BDD tests for parser error translation across ACL boundary."""
 
-    @pytest.fixture
-    def sample_question(self):
-        """Sample question for testing."""
-        return Question(
-            id="test_q1", text="What is 2+2?", expected_answer="4", metadata={}
-        )
-
-    @pytest.fixture
-    def sample_agent_config(self):
-        """Sample agent configuration."""
-        return AgentConfig(
-            agent_type="none",
-            model_provider="anthropic",
-            model_name="claude-3-sonnet",
-            model_parameters={"temperature": 0.1},
-            agent_parameters={},
-        )
-
-    @pytest.fixture
-    def domain_service(self):
-        """Domain service for testing."""
-        return NoneAgentService()
-
     async def test_empty_response_becomes_parsing_error(
-        self, sample_question, sample_agent_config, domain_service
+        self,
+        sample_question,
+        sample_agent_config,
+        domain_service,
+        error_mapper,
+        mock_llm_pair,
     ):
         """Given LLM returns response without structured_data, when execute_reasoning, then returns FailureReason"""
-        # Arrange - Mock LLM client that returns response without structured data (AsyncMock for async methods)
-        mock_llm_client = AsyncMock()
-        mock_llm_client.chat_completion.return_value = ParsedResponse(
-            content="Some natural language response",  # Valid content but no structured_data
-            structured_data=None,  # Missing structured_data will trigger parser error
-        )
-
-        # Mock factory to return our mock client
-        mock_factory = Mock(spec=LLMClientFactory)
-        mock_factory.create_client.return_value = mock_llm_client
+        # Arrange - Mock LLM client that returns response without structured data
+        mock_factory, _ = mock_llm_pair(_UNSTRUCTURED_RESPONSE)
 
         service = ReasoningInfrastructureService(
             llm_client_factory=mock_factory,
-            error_mapper=OpenRouterErrorMapper(),
+            error_mapper=error_mapper,
             parsing_strategy="marvin",
         )
 
@@ -245,29 +201,27 @@ class TestParserErrorTranslation:
         assert result.category == "parsing_error"
         assert "failed at" in result.description
         # Parser type should be the parsing strategy used (marvin, outlines, native, auto)
-        assert (
-            "marvin" in result.description.lower()
-            or "outlines" in result.description.lower()
-            or "native" in result.description.lower()
-            or "auto" in result.description.lower()
+        description = result.description.lower()
+        assert any(
+            token in description for token in _PARSER_TOKENS
         ), "Error message should reference parser strategy"
         assert result.recoverable is False
 
     async def test_api_exception_becomes_failure_reason(
-        self, sample_question, sample_agent_config, domain_service
+        self,
+        sample_question,
+        sample_agent_config,
+        domain_service,
+        error_mapper,
+        mock_llm_pair,
     ):
         """Given LLM client throws exception, when execute_reasoning, then returns FailureReason"""
-        # Arrange - Mock LLM client that throws exception (AsyncMock for async methods)
-        mock_llm_client = AsyncMock()
-        mock_llm_client.chat_completion.side_effect = Exception("API connection failed")
-
-        # Mock factory to return our mock client
-        mock_factory = Mock(spec=LLMClientFactory)
-        mock_factory.create_client.return_value = mock_llm_client
+        # Arrange - Mock LLM client that throws exception
+        mock_factory, _ = mock_llm_pair(Exception("API connection failed"))
 
         service = ReasoningInfrastructureService(
             llm_client_factory=mock_factory,
-            error_mapper=OpenRouterErrorMapper(),
+            error_mapper=error_mapper,
             parsing_strategy="outlines",
         )
 
@@ -284,21 +238,20 @@ class TestParserErrorTranslation:
 class TestConfigurationIntegration:
     """BDD tests for configuration loading and service integration."""
 
-    @patch.dict(os.environ, {"PARSING_STRATEGY": "outlines"})
-    def test_environment_variable_loads_into_config(self):
+    def test_environment_variable_loads_into_config(self, configs_by_strategy):
         """Given PARSING_STRATEGY=outlines in environment, when loading config, then strategy is set"""
         # Act
-        config = get_config()
+        config = configs_by_strategy["outlines"]
 
         # Assert
         assert config.parsing_strategy == "outlines"
 
-    @patch.dict(os.environ, {"PARSING_STRATEGY": "marvin"})
-    def test_marvin_strategy_environment_integration(self):
+    def test_marvin_strategy_environment_integration(
+        self, configs_by_strategy, mock_factory
+    ):
         """Given PARSING_STRATEGY=marvin in environment, when creating service, then strategy is passed"""
         # Act
-        config = get_config()
-        mock_factory = Mock(spec=LLMClientFactory)
+        config = configs_by_strategy["marvin"]
         service = ReasoningInfrastructureService(
             llm_client_factory=mock_factory,
             error_mapper=Mock(),
@@ -308,15 +261,10 @@ class TestConfigurationIntegration:
         # Assert
         assert service.parsing_strategy == "marvin"
 
-    def test_default_parsing_strategy_is_auto(self):
+    def test_default_parsing_strategy_is_auto(self, monkeypatch):
         """Given no PARSING_STRATEGY environment variable, when loading config, then defaults to auto"""
         # Ensure env var is not set
-        with patch.dict(os.environ, {}, clear=True):
-            if "PARSING_STRATEGY" in os.environ:
-                del os.environ["PARSING_STRATEGY"]
-
-            # Act
-            config = get_config()
+        monkeypatch.delenv("PARSING_STRATEGY", raising=False)
 
-            # Assert
-            assert config.parsing_strategy == "auto"
+        # Act / Assert
+        assert get_config().parsing_strategy == "auto"
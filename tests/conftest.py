@@ -1,26 +1,39 @@
 """Pytest configuration and shared fixtures."""
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
 
-@pytest.fixture
-def mock_openrouter_responses() -> dict[str, Any]:
-    """Mock responses from OpenRouter API."""
-    return {
-        "2+2": {
-            "choices": [
-                {
-                    "message": {
-                        "content": "Let me think step by step. 2 + 2 = 4. Therefore, the answer is 4."
+def pytest_configure(config: pytest.Config) -> None:
+    """Check the interpreter once per session, before collection."""
+    # Matches requires-python in pyproject.toml
+    assert sys.version_info >= (3, 10), f"Python 3.10+ required, got {sys.version_info}"
+
+
+@pytest.fixture(scope="session")
+def mock_openrouter_responses() -> Mapping[str, Any]:
+    """Mock responses from OpenRouter API, read-only so tests can share them."""
+    return MappingProxyType(
+        {
+            "2+2": {
+                "choices": [
+                    {
+                        "message": {
+                            "content": "Let me think step by step. 2 + 2 = 4. Therefore, the answer is 4."
+                        }
                     }
-                }
-            ],
-            "usage": {"prompt_tokens": 10, "completion_tokens": 15},
-        },
-        "capital_france": {
-            "choices": [{"message": {"content": "The capital of France is Paris."}}],
-            "usage": {"prompt_tokens": 12, "completion_tokens": 8},
-        },
-    }
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 15},
+            },
+            "capital_france": {
+                "choices": [
+                    {"message": {"content": "The capital of France is Paris."}}
+                ],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 8},
+            },
+        }
+    )
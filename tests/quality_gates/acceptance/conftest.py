@@ -0,0 +1,44 @@
+"""Shared fixtures for CLI acceptance tests."""
+
+from collections.abc import Callable
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+from pytest_mock import MockerFixture
+
+from ml_agents_v2.infrastructure.health_checker import HealthStatus
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Click test runner shared across a test module."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_container(mocker: MockerFixture) -> Mock:
+    """Replace the CLI's dependency injection container with a mock.
+
+    Returns the container instance the CLI receives, so tests configure
+    services on it directly, e.g.
+    ``mock_container.benchmark_processor.return_value = processor``.
+    """
+    container_class: Mock = mocker.patch("ml_agents_v2.cli.main.Container")
+    return container_class.return_value
+
+
+@pytest.fixture
+def set_health_status(
+    mock_container: Mock,
+) -> Callable[[HealthStatus | Exception], None]:
+    """Make the mocked health checker report a status or raise an error."""
+    mock_health_checker = mock_container.health_checker.return_value
+
+    def set_status(outcome: HealthStatus | Exception) -> None:
+        if isinstance(outcome, Exception):
+            mock_health_checker.check_health.side_effect = outcome
+        else:
+            mock_health_checker.check_health.return_value = outcome
+
+    return set_status
@@ -2,9 +2,8 @@
 
 import uuid
 from datetime import datetime
-from unittest.mock import Mock, patch
 
-from click.testing import CliRunner
+import pytest
 
 from ml_agents_v2.cli.main import cli
 from ml_agents_v2.core.domain.entities.preprocessed_benchmark import (
@@ -13,13 +12,58 @@ from ml_agents_v2.core.domain.entities.preprocessed_benchmark import (
 from ml_agents_v2.core.domain.value_objects.question import Question
 
 
+class FakeBenchmarkProcessor:
+    """Stub BenchmarkProcessor exposing only what the benchmark commands use."""
+
+    def __init__(
+        self,
+        benchmarks: list[PreprocessedBenchmark] | None = None,
+        details: PreprocessedBenchmark | None = None,
+        error: Exception | None = None,
+    ):
+        self._benchmarks = benchmarks or []
+        self._details = details
+        self._error = error
+
+    def list_available_benchmarks(self) -> list[PreprocessedBenchmark]:
+        return self._benchmarks
+
+    def get_benchmark_details(self, name: str) -> PreprocessedBenchmark | None:
+        if self._error is not None:
+            raise self._error
+        return self._details
+
+
+class FakeContainer:
+    """Stub Container providing a single benchmark processor."""
+
+    def __init__(self, benchmark_processor: FakeBenchmarkProcessor):
+        self._benchmark_processor = benchmark_processor
+
+    def wire(self, modules: list[str]) -> None:
+        pass
+
+    def benchmark_processor(self) -> FakeBenchmarkProcessor:
+        return self._benchmark_processor
+
+
+@pytest.fixture
+def use_benchmark_processor(monkeypatch):
+    """Install a FakeContainer serving the given benchmark processor."""
+
+    def install(processor: FakeBenchmarkProcessor) -> None:
+        monkeypatch.setattr(
+            "ml_agents_v2.cli.main.Container", lambda: FakeContainer(processor)
+        )
+
+    return install
+
+
 class TestBenchmarkCommands:
     """Test benchmark management commands."""
 
-    def test_benchmark_list_command_success(self):
+    def test_benchmark_list_command_success(self, runner, use_benchmark_processor):
         """Test benchmark list command shows available benchmarks."""
-        runner = CliRunner()
-
         # Mock benchmark data
         questions = [
             Question(
@@ -53,49 +97,27 @@ class TestBenchmarkCommands:
             ),
         ]
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_benchmark_processor = Mock()
-            mock_benchmark_processor.list_available_benchmarks.return_value = (
-                mock_benchmarks
-            )
-
-            mock_container_instance = Mock()
-            mock_container_instance.benchmark_processor.return_value = (
-                mock_benchmark_processor
-            )
-            mock_container.return_value = mock_container_instance
+        use_benchmark_processor(FakeBenchmarkProcessor(benchmarks=mock_benchmarks))
 
-            result = runner.invoke(cli, ["benchmark", "list"])
+        result = runner.invoke(cli, ["benchmark", "list"])
 
-            assert result.exit_code == 0
-            assert "GPQA" in result.output
-            assert "FOLIO" in result.output
-            assert "Graduate-level physics" in result.output
-            assert "Logic-based reasoning" in result.output
+        assert result.exit_code == 0
+        assert "GPQA" in result.output
+        assert "FOLIO" in result.output
+        assert "Graduate-level physics" in result.output
+        assert "Logic-based reasoning" in result.output
 
-    def test_benchmark_list_command_empty(self):
+    def test_benchmark_list_command_empty(self, runner, use_benchmark_processor):
         """Test benchmark list command when no benchmarks available."""
-        runner = CliRunner()
+        use_benchmark_processor(FakeBenchmarkProcessor(benchmarks=[]))
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_benchmark_processor = Mock()
-            mock_benchmark_processor.list_available_benchmarks.return_value = []
+        result = runner.invoke(cli, ["benchmark", "list"])
 
-            mock_container_instance = Mock()
-            mock_container_instance.benchmark_processor.return_value = (
-                mock_benchmark_processor
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(cli, ["benchmark", "list"])
-
-            assert result.exit_code == 0
-            assert "No benchmarks available" in result.output
+        assert result.exit_code == 0
+        assert "No benchmarks available" in result.output
 
-    def test_benchmark_show_command_success(self):
+    def test_benchmark_show_command_success(self, runner, use_benchmark_processor):
         """Test benchmark show command displays detailed benchmark info."""
-        runner = CliRunner()
-
         # Create detailed benchmark for show command
         questions = [
             Question(id="q1", text="What is 2+2?", expected_answer="4", metadata={}),
@@ -126,70 +148,42 @@ class TestBenchmarkCommands:
             format_version="1.0",
         )
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_benchmark_processor = Mock()
-            mock_benchmark_processor.get_benchmark_details.return_value = mock_benchmark
+        use_benchmark_processor(FakeBenchmarkProcessor(details=mock_benchmark))
 
-            mock_container_instance = Mock()
-            mock_container_instance.benchmark_processor.return_value = (
-                mock_benchmark_processor
-            )
-            mock_container.return_value = mock_container_instance
+        result = runner.invoke(cli, ["benchmark", "show", "SAMPLE"])
 
-            result = runner.invoke(cli, ["benchmark", "show", "SAMPLE"])
+        assert result.exit_code == 0
+        assert "SAMPLE_BENCHMARK" in result.output
+        assert "Sample test benchmark" in result.output
+        assert "Questions: 3" in result.output
+        # Note: Individual question text and metadata not shown in summary view
+        # This is expected per CLI design - use evaluate create to work with questions
 
-            assert result.exit_code == 0
-            assert "SAMPLE_BENCHMARK" in result.output
-            assert "Sample test benchmark" in result.output
-            assert "Questions: 3" in result.output
-            # Note: Individual question text and metadata not shown in summary view
-            # This is expected per CLI design - use evaluate create to work with questions
-
-    def test_benchmark_show_command_not_found(self):
+    def test_benchmark_show_command_not_found(self, runner, use_benchmark_processor):
         """Test benchmark show command when benchmark doesn't exist."""
-        runner = CliRunner()
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_benchmark_processor = Mock()
-            mock_benchmark_processor.get_benchmark_details.return_value = None
-
-            mock_container_instance = Mock()
-            mock_container_instance.benchmark_processor.return_value = (
-                mock_benchmark_processor
-            )
-            mock_container.return_value = mock_container_instance
+        use_benchmark_processor(FakeBenchmarkProcessor(details=None))
 
-            result = runner.invoke(cli, ["benchmark", "show", "NONEXISTENT"])
+        result = runner.invoke(cli, ["benchmark", "show", "NONEXISTENT"])
 
-            assert result.exit_code == 1
-            assert "Benchmark 'NONEXISTENT' not found" in result.output
+        assert result.exit_code == 1
+        assert "Benchmark 'NONEXISTENT' not found" in result.output
 
-    def test_benchmark_show_command_error_handling(self):
+    def test_benchmark_show_command_error_handling(
+        self, runner, use_benchmark_processor
+    ):
         """Test benchmark show command handles service errors gracefully."""
-        runner = CliRunner()
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_benchmark_processor = Mock()
-            mock_benchmark_processor.get_benchmark_details.side_effect = Exception(
-                "Database connection failed"
-            )
-
-            mock_container_instance = Mock()
-            mock_container_instance.benchmark_processor.return_value = (
-                mock_benchmark_processor
-            )
-            mock_container.return_value = mock_container_instance
+        use_benchmark_processor(
+            FakeBenchmarkProcessor(error=Exception("Database connection failed"))
+        )
 
-            result = runner.invoke(cli, ["benchmark", "show", "SAMPLE"])
+        result = runner.invoke(cli, ["benchmark", "show", "SAMPLE"])
 
-            assert result.exit_code == 1
-            assert "Error retrieving benchmark" in result.output
-            assert "Database connection failed" in result.output
+        assert result.exit_code == 1
+        assert "Error retrieving benchmark" in result.output
+        assert "Database connection failed" in result.output
 
-    def test_benchmark_list_with_verbose_option(self):
+    def test_benchmark_list_with_verbose_option(self, runner, use_benchmark_processor):
         """Test benchmark list command with verbose flag shows more details."""
-        runner = CliRunner()
-
         # Create 50 unique questions
         questions = [
             Question(
@@ -213,24 +207,14 @@ class TestBenchmarkCommands:
             )
         ]
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_benchmark_processor = Mock()
-            mock_benchmark_processor.list_available_benchmarks.return_value = (
-                mock_benchmarks
-            )
-
-            mock_container_instance = Mock()
-            mock_container_instance.benchmark_processor.return_value = (
-                mock_benchmark_processor
-            )
-            mock_container.return_value = mock_container_instance
+        use_benchmark_processor(FakeBenchmarkProcessor(benchmarks=mock_benchmarks))
 
-            result = runner.invoke(cli, ["--verbose", "benchmark", "list"])
+        result = runner.invoke(cli, ["--verbose", "benchmark", "list"])
 
-            assert result.exit_code == 0
-            assert "VERBOSE_TEST" in result.output
-            assert "50 questions" in result.output  # Verbose should show question count
-            assert "complexity: high" in result.output  # Verbose should show metadata
+        assert result.exit_code == 0
+        assert "VERBOSE_TEST" in result.output
+        assert "50 questions" in result.output  # Verbose should show question count
+        assert "complexity: high" in result.output  # Verbose should show metadata
 
     # NOTE: Integration test removed due to complex CLI mocking requirements
     # The individual benchmark commands are tested separately and work correctly
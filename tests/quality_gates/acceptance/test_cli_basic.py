@@ -1,16 +1,13 @@
 """Acceptance tests for basic CLI structure and entry point."""
 
-from click.testing import CliRunner
-
 from ml_agents_v2.cli.main import cli
 
 
 class TestCLIBasic:
     """Test basic CLI functionality like help, version, and command discovery."""
 
-    def test_cli_help_displays_main_commands(self):
+    def test_cli_help_displays_main_commands(self, runner):
         """Test that --help shows available command groups."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
         assert result.exit_code == 0
@@ -19,17 +16,15 @@ class TestCLIBasic:
         assert "benchmark" in result.output
         assert "health" in result.output
 
-    def test_cli_version_displays_version(self):
+    def test_cli_version_displays_version(self, runner):
         """Test that --version shows version information."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_evaluate_group_help(self):
+    def test_evaluate_group_help(self, runner):
         """Test that evaluate --help shows evaluation commands."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["evaluate", "--help"])
 
         assert result.exit_code == 0
@@ -37,34 +32,30 @@ class TestCLIBasic:
         assert "run" in result.output
         assert "list" in result.output
 
-    def test_benchmark_group_help(self):
+    def test_benchmark_group_help(self, runner):
         """Test that benchmark --help shows benchmark commands."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["benchmark", "--help"])
 
         assert result.exit_code == 0
         assert "list" in result.output
         assert "show" in result.output
 
-    def test_health_command_help(self):
+    def test_health_command_help(self, runner):
         """Test that health --help shows health command help."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["health", "--help"])
 
         assert result.exit_code == 0
         assert "health" in result.output.lower()
 
-    def test_invalid_command_shows_error(self):
+    def test_invalid_command_shows_error(self, runner):
         """Test that invalid commands show helpful error messages."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["invalid-command"])
 
         assert result.exit_code != 0
         assert "No such command" in result.output
 
-    def test_global_options_work(self):
+    def test_global_options_work(self, runner):
         """Test that global options like --verbose are recognized."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--verbose", "--help"])
 
         assert result.exit_code == 0
@@ -1,142 +1,147 @@
 """Acceptance tests for evaluate command functionality."""
 
+import re
 import uuid
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
 
-from click.testing import CliRunner
+import pytest
 
 from ml_agents_v2.cli.main import cli
-from ml_agents_v2.core.domain.entities.evaluation import Evaluation
-from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
+from ml_agents_v2.core.application.dto.evaluation_info import EvaluationInfo
+from ml_agents_v2.core.application.dto.progress_info import ProgressInfo
+from ml_agents_v2.core.domain.repositories.exceptions import EntityNotFoundError
+from ml_agents_v2.core.domain.value_objects.evaluation_results import EvaluationResults
+
+# Fixed ids keep output assertions deterministic; the mocks only need them
+# to be distinct.
+EVALUATION_ID = uuid.UUID("5f0c3a2e-8b1d-4c6f-9a7e-2d4b6c8e0f13")
+OTHER_EVALUATION_ID = uuid.UUID("a17e9c40-3d52-4b8f-8e61-7c9f0b2d4e58")
+CREATED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+# Rows returned by list_evaluations; frozen DTOs, so tests share them.
+LISTED_EVALUATIONS = (
+    EvaluationInfo(
+        evaluation_id=EVALUATION_ID,
+        agent_type="chain_of_thought",
+        model_name="claude-3-sonnet",
+        benchmark_name="GPQA",
+        status="completed",
+        accuracy=97.5,
+        created_at=CREATED_AT,
+        completed_at=CREATED_AT,
+        total_questions=40,
+        correct_answers=39,
+    ),
+    EvaluationInfo(
+        evaluation_id=OTHER_EVALUATION_ID,
+        agent_type="none",
+        model_name="gpt-4",
+        benchmark_name="FOLIO",
+        status="failed",
+        accuracy=None,
+        created_at=CREATED_AT,
+        completed_at=None,
+        total_questions=None,
+        correct_answers=None,
+    ),
+)
+
+# Every fragment the create command prints on success, in any order.
+CREATE_SUCCESS_OUTPUT = re.compile(
+    "".join(
+        f"(?=.*{re.escape(fragment)})"
+        for fragment in (
+            "✓ Created evaluation",
+            str(EVALUATION_ID)[:8],  # Short ID
+            "pending",
+            "anthropic/claude-3-sonnet",
+            "GPQA",
+            "ml-agents evaluate run",
+        )
+    ),
+    re.DOTALL,
+)
+
+# ProgressInfo is frozen, so a single instance can be shared by every run test.
+INITIAL_PROGRESS = ProgressInfo(
+    evaluation_id=EVALUATION_ID,
+    current_question=0,
+    total_questions=100,
+    successful_answers=0,
+    failed_questions=0,
+    started_at=CREATED_AT,
+    last_updated=CREATED_AT,
+)
 
 
 class TestEvaluateCommands:
     """Test evaluation management commands."""
 
-    def test_evaluate_create_command_success(self):
+    def test_evaluate_create_command_success(self, runner, mock_container):
         """Test evaluate create command creates new evaluation."""
-        runner = CliRunner()
-
         # Mock successful evaluation creation
-        mock_evaluation_id = uuid.uuid4()
-        _mock_evaluation = Evaluation(
-            evaluation_id=mock_evaluation_id,
-            agent_config=AgentConfig(
-                agent_type="chain_of_thought",
-                model_provider="anthropic",
-                model_name="claude-3-sonnet",
-                model_parameters={"temperature": 1.0, "max_tokens": 1000},
-                agent_parameters={},
-            ),
-            preprocessed_benchmark_id=uuid.uuid4(),
-            status="pending",
-            created_at=datetime.now(),
-            started_at=None,
-            completed_at=None,
-            results=None,
-            failure_reason=None,
+        mock_evaluation_id = EVALUATION_ID
+
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.create_evaluation.return_value = mock_evaluation_id
+
+        result = runner.invoke(
+            cli,
+            [
+                "evaluate",
+                "create",
+                "--agent",
+                "cot",
+                "--model",
+                "anthropic/claude-3-sonnet",
+                "--benchmark",
+                "GPQA",
+            ],
         )
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.create_evaluation.return_value = mock_evaluation_id
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(
-                cli,
-                [
-                    "evaluate",
-                    "create",
-                    "--agent",
-                    "cot",
-                    "--model",
-                    "anthropic/claude-3-sonnet",
-                    "--benchmark",
-                    "GPQA",
-                ],
-            )
-
-            assert result.exit_code == 0
-            assert "✓ Created evaluation" in result.output
-            assert str(mock_evaluation_id)[:8] in result.output  # Short ID
-            assert "pending" in result.output
-            assert "cot" in result.output or "Chain of Thought" in result.output
-            assert "anthropic/claude-3-sonnet" in result.output
-            assert "GPQA" in result.output
-            assert "ml-agents evaluate run" in result.output
-
-    def test_evaluate_create_command_with_options(self):
+        assert result.exit_code == 0
+        assert CREATE_SUCCESS_OUTPUT.search(result.output)
+        assert "cot" in result.output or "Chain of Thought" in result.output
+
+    def test_evaluate_create_command_with_options(self, runner, mock_container):
         """Test evaluate create command with temperature and max-tokens options."""
-        runner = CliRunner()
-
-        mock_evaluation_id = uuid.uuid4()
-        _mock_evaluation = Evaluation(
-            evaluation_id=mock_evaluation_id,
-            agent_config=AgentConfig(
-                agent_type="none",
-                model_provider="openai",
-                model_name="gpt-4",
-                model_parameters={"temperature": 0.5, "max_tokens": 2000},
-                agent_parameters={},
-            ),
-            preprocessed_benchmark_id=uuid.uuid4(),
-            status="pending",
-            created_at=datetime.now(),
-            started_at=None,
-            completed_at=None,
-            results=None,
-            failure_reason=None,
+        mock_evaluation_id = EVALUATION_ID
+
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.create_evaluation.return_value = mock_evaluation_id
+
+        result = runner.invoke(
+            cli,
+            [
+                "evaluate",
+                "create",
+                "--agent",
+                "none",
+                "--model",
+                "openai/gpt-4",
+                "--benchmark",
+                "FOLIO",
+                "--temp",
+                "0.5",
+                "--max-tokens",
+                "2000",
+            ],
         )
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.create_evaluation.return_value = mock_evaluation_id
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(
-                cli,
-                [
-                    "evaluate",
-                    "create",
-                    "--agent",
-                    "none",
-                    "--model",
-                    "openai/gpt-4",
-                    "--benchmark",
-                    "FOLIO",
-                    "--temp",
-                    "0.5",
-                    "--max-tokens",
-                    "2000",
-                ],
-            )
-
-            assert result.exit_code == 0
-            assert "✓ Created evaluation" in result.output
-            assert "none" in result.output or "Direct" in result.output
-            assert "gpt-4" in result.output
-
-            # Verify orchestrator was called with correct config
-            mock_orchestrator.create_evaluation.assert_called_once()
-            call_args = mock_orchestrator.create_evaluation.call_args[1]
-            assert call_args["agent_config"].model_parameters["temperature"] == 0.5
-            assert call_args["agent_config"].model_parameters["max_tokens"] == 2000
-
-    def test_evaluate_create_command_invalid_agent(self):
-        """Test evaluate create command with invalid agent type."""
-        runner = CliRunner()
+        assert result.exit_code == 0
+        assert "✓ Created evaluation" in result.output
+        assert "none" in result.output or "Direct" in result.output
+        assert "gpt-4" in result.output
 
+        # Verify orchestrator was called with correct config
+        mock_orchestrator.create_evaluation.assert_called_once()
+        call_args = mock_orchestrator.create_evaluation.call_args[1]
+        assert call_args["agent_config"].model_parameters["temperature"] == 0.5
+        assert call_args["agent_config"].model_parameters["max_tokens"] == 2000
+
+    def test_evaluate_create_command_invalid_agent(self, runner):
+        """Test evaluate create command with invalid agent type."""
         result = runner.invoke(
             cli,
             [
@@ -156,343 +161,189 @@ class TestEvaluateCommands:
         assert "none" in result.output
         assert "cot" in result.output
 
-    def test_evaluate_create_command_benchmark_not_found(self):
+    def test_evaluate_create_command_benchmark_not_found(self, runner, mock_container):
         """Test evaluate create command when benchmark doesn't exist."""
-        runner = CliRunner()
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.create_evaluation.side_effect = ValueError(
-                "Benchmark 'UNKNOWN' not found"
-            )
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(
-                cli,
-                [
-                    "evaluate",
-                    "create",
-                    "--agent",
-                    "cot",
-                    "--model",
-                    "anthropic/claude-3-sonnet",
-                    "--benchmark",
-                    "UNKNOWN",
-                ],
-            )
-
-            assert result.exit_code == 1
-            assert "✗ Error" in result.output
-            assert "Benchmark 'UNKNOWN' not found" in result.output
-            assert "ml-agents benchmark list" in result.output
-
-    def test_evaluate_run_command_success(self):
-        """Test evaluate run command executes evaluation with progress."""
-        runner = CliRunner()
-
-        evaluation_id = str(uuid.uuid4())
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-
-            # Mock get_evaluation_info to return pending evaluation
-            from ml_agents_v2.core.application.dto.evaluation_info import EvaluationInfo
-
-            pending_evaluation = Mock(spec=EvaluationInfo)
-            pending_evaluation.status = "pending"
-            pending_evaluation.evaluation_id = uuid.UUID(evaluation_id)
-            mock_orchestrator.get_evaluation_info.return_value = pending_evaluation
-
-            # Mock get_evaluation_progress
-            from ml_agents_v2.core.application.dto.progress_info import ProgressInfo
-
-            progress_info = Mock(spec=ProgressInfo)
-            progress_info.total_questions = 100
-            progress_info.current_question = 0
-            progress_info.success_rate = 0.0
-            mock_orchestrator.get_evaluation_progress.return_value = progress_info
-
-            # Mock successful execution - must be async
-            async def mock_execute():
-                pass
-
-            mock_orchestrator.execute_evaluation.return_value = mock_execute()
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(cli, ["evaluate", "run", evaluation_id])
-
-            assert result.exit_code == 0
-            assert f"Starting evaluation {evaluation_id[:8]}" in result.output
-            assert "✓ Completed" in result.output
-
-    def test_evaluate_run_command_not_found(self):
-        """Test evaluate run command when evaluation doesn't exist."""
-        runner = CliRunner()
-
-        evaluation_id = str(uuid.uuid4())
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            # Mock get_evaluation_info to raise EntityNotFoundError
-            from ml_agents_v2.core.domain.repositories.exceptions import (
-                EntityNotFoundError,
-            )
-
-            mock_orchestrator.get_evaluation_info.side_effect = EntityNotFoundError(
-                "Evaluation", evaluation_id
-            )
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(cli, ["evaluate", "run", evaluation_id])
-
-            assert result.exit_code == 1
-            assert "✗ Error" in result.output
-            assert evaluation_id in result.output
-
-    def test_evaluate_run_command_already_completed(self):
-        """Test evaluate run command on already completed evaluation."""
-        runner = CliRunner()
-
-        evaluation_id = str(uuid.uuid4())
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            # Mock get_evaluation_info to return completed evaluation
-            from ml_agents_v2.core.application.dto.evaluation_info import EvaluationInfo
-
-            completed_evaluation = Mock(spec=EvaluationInfo)
-            completed_evaluation.status = "completed"
-            completed_evaluation.evaluation_id = uuid.UUID(evaluation_id)
-            mock_orchestrator.get_evaluation_info.return_value = completed_evaluation
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(cli, ["evaluate", "run", evaluation_id])
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.create_evaluation.side_effect = ValueError(
+            "Benchmark 'UNKNOWN' not found"
+        )
 
-            assert result.exit_code == 0  # CLI returns 0 but doesn't run the evaluation
-            assert "already completed" in result.output
+        result = runner.invoke(
+            cli,
+            [
+                "evaluate",
+                "create",
+                "--agent",
+                "cot",
+                "--model",
+                "anthropic/claude-3-sonnet",
+                "--benchmark",
+                "UNKNOWN",
+            ],
+        )
 
-    def _disabled_test_evaluate_list_command_success(self):
+        assert result.exit_code == 1
+        assert "✗ Error" in result.output
+        assert "Benchmark 'UNKNOWN' not found" in result.output
+        assert "ml-agents benchmark list" in result.output
+
+    @pytest.mark.parametrize(
+        ("evaluation_info", "expected_exit_code", "expected_output"),
+        [
+            pytest.param(
+                "pending",
+                0,
+                (f"Starting evaluation {str(EVALUATION_ID)[:8]}", "✓ Completed"),
+                id="success",
+            ),
+            pytest.param(
+                EntityNotFoundError("Evaluation", str(EVALUATION_ID)),
+                1,
+                ("✗ Error", str(EVALUATION_ID)),
+                id="not_found",
+            ),
+            pytest.param(
+                "completed",
+                0,  # CLI returns 0 but doesn't run the evaluation
+                ("already completed",),
+                id="already_completed",
+            ),
+        ],
+    )
+    def test_evaluate_run_command(
+        self,
+        runner,
+        mock_container,
+        evaluation_info,
+        expected_exit_code,
+        expected_output,
+    ):
+        """Test evaluate run command for pending, missing and completed evaluations."""
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+
+        # get_evaluation_info either returns an evaluation in the given status
+        # or raises the given error
+        if isinstance(evaluation_info, Exception):
+            mock_orchestrator.get_evaluation_info.side_effect = evaluation_info
+        else:
+            evaluation = Mock(spec=EvaluationInfo)
+            evaluation.status = evaluation_info
+            evaluation.evaluation_id = EVALUATION_ID
+            mock_orchestrator.get_evaluation_info.return_value = evaluation
+
+        mock_orchestrator.get_evaluation_progress.return_value = INITIAL_PROGRESS
+
+        # Mock successful execution - must be async
+        mock_orchestrator.execute_evaluation = AsyncMock(return_value=None)
+
+        result = runner.invoke(cli, ["evaluate", "run", str(EVALUATION_ID)])
+
+        assert result.exit_code == expected_exit_code
+        for fragment in expected_output:
+            assert fragment in result.output
+
+    def _disabled_test_evaluate_list_command_success(self, runner, mock_container):
         """Test evaluate list command shows evaluations in table format."""
-        runner = CliRunner()
-
-        # Mock evaluation data
-        # Create proper mock evaluation objects
-        eval1_id = uuid.uuid4()
-        eval2_id = uuid.uuid4()
-
-        from ml_agents_v2.core.application.dto.evaluation_info import EvaluationInfo
-
-        mock_eval1 = Mock(spec=EvaluationInfo)
-        mock_eval1.evaluation_id = eval1_id
-        mock_eval1.status = "completed"
-        mock_eval1.agent_type = "chain_of_thought"
-        mock_eval1.model_name = "claude-3-sonnet"
-        mock_eval1.benchmark_name = "GPQA"
-        mock_eval1.created_at = datetime.now()
-
-        mock_eval2 = Mock(spec=EvaluationInfo)
-        mock_eval2.evaluation_id = eval2_id
-        mock_eval2.status = "failed"
-        mock_eval2.agent_type = "none"
-        mock_eval2.model_name = "gpt-4"
-        mock_eval2.benchmark_name = "FOLIO"
-        mock_eval2.created_at = datetime.now()
-
-        mock_evaluations = [mock_eval1, mock_eval2]
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.list_evaluations.return_value = mock_evaluations
-
-            # Mock get_evaluation_results for completed evaluation
-            from ml_agents_v2.core.domain.value_objects.evaluation_results import (
-                EvaluationResults,
-            )
-
-            mock_results = Mock(spec=EvaluationResults)
-            mock_results.accuracy = 98.7
-            mock_orchestrator.get_evaluation_results.return_value = mock_results
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(cli, ["evaluate", "list"])
-
-            assert result.exit_code == 0
-            assert "ID" in result.output
-            assert "Status" in result.output
-            assert "Agent" in result.output
-            assert "Model" in result.output
-            assert "Benchmark" in result.output
-            assert "Accuracy" in result.output
-            assert "completed" in result.output
-            assert "failed" in result.output
-            assert "98.7%" in result.output
-            assert "GPQA" in result.output
-            assert "FOLIO" in result.output
-
-    def _disabled_test_evaluate_list_command_with_filters(self):
+        mock_evaluations = list(LISTED_EVALUATIONS)
+
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.list_evaluations.return_value = mock_evaluations
+
+        # Mock get_evaluation_results for completed evaluation
+        mock_results = Mock(spec=EvaluationResults)
+        mock_results.accuracy = 98.7
+        mock_orchestrator.get_evaluation_results.return_value = mock_results
+
+        result = runner.invoke(cli, ["evaluate", "list"])
+
+        assert result.exit_code == 0
+        assert "ID" in result.output
+        assert "Status" in result.output
+        assert "Agent" in result.output
+        assert "Model" in result.output
+        assert "Benchmark" in result.output
+        assert "Accuracy" in result.output
+        assert "completed" in result.output
+        assert "failed" in result.output
+        assert "98.7%" in result.output
+        assert "GPQA" in result.output
+        assert "FOLIO" in result.output
+
+    def _disabled_test_evaluate_list_command_with_filters(self, runner, mock_container):
         """Test evaluate list command with status and benchmark filters."""
-        runner = CliRunner()
-
-        mock_evaluations = [
-            {
-                "evaluation_id": uuid.uuid4(),
-                "status": "completed",
-                "agent_type": "chain_of_thought",
-                "model_name": "claude-3-sonnet",
-                "benchmark_name": "GPQA",
-                "accuracy": 95.0,
-                "created_at": datetime.now(),
-            }
-        ]
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.list_evaluations.return_value = mock_evaluations
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
-
-            result = runner.invoke(
-                cli,
-                ["evaluate", "list", "--status", "completed", "--benchmark", "GPQA"],
-            )
-
-            assert result.exit_code == 0
-            assert "completed" in result.output
-            assert "GPQA" in result.output
-
-            # Verify filters were passed to orchestrator
-            mock_orchestrator.list_evaluations.assert_called_once()
-            call_args = mock_orchestrator.list_evaluations.call_args[1]
-            assert call_args.get("status_filter") == "completed"
-            assert call_args.get("benchmark_filter") == "GPQA"
-
-    def test_evaluate_list_command_empty(self):
-        """Test evaluate list command when no evaluations exist."""
-        runner = CliRunner()
+        mock_evaluations = list(LISTED_EVALUATIONS[:1])
 
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.list_evaluations.return_value = []
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.list_evaluations.return_value = mock_evaluations
 
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container.return_value = mock_container_instance
+        result = runner.invoke(
+            cli,
+            ["evaluate", "list", "--status", "completed", "--benchmark", "GPQA"],
+        )
+
+        assert result.exit_code == 0
+        assert "completed" in result.output
+        assert "GPQA" in result.output
+
+        # Verify filters were passed to orchestrator
+        mock_orchestrator.list_evaluations.assert_called_once()
+        call_args = mock_orchestrator.list_evaluations.call_args[1]
+        assert call_args.get("status_filter") == "completed"
+        assert call_args.get("benchmark_filter") == "GPQA"
+
+    def test_evaluate_list_command_empty(self, runner, mock_container):
+        """Test evaluate list command when no evaluations exist."""
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.list_evaluations.return_value = []
 
-            result = runner.invoke(cli, ["evaluate", "list"])
+        result = runner.invoke(cli, ["evaluate", "list"])
 
-            assert result.exit_code == 0
-            assert "No evaluations found" in result.output
+        assert result.exit_code == 0
+        assert "No evaluations found" in result.output
 
-    def _disabled_test_evaluate_commands_integration_workflow(self):
+    @pytest.mark.skip(
+        reason="Run step mocks predate async execute_evaluation and ProgressInfo DTO"
+    )
+    def test_evaluate_commands_integration_workflow(self, runner, mock_container):
         """Test complete workflow: create → run → list evaluation."""
-        runner = CliRunner()
-
-        evaluation_id = uuid.uuid4()
-        _mock_evaluation = Evaluation(
-            evaluation_id=evaluation_id,
-            agent_config=AgentConfig(
-                agent_type="chain_of_thought",
-                model_provider="anthropic",
-                model_name="claude-3-sonnet",
-                model_parameters={"temperature": 1.0, "max_tokens": 1000},
-                agent_parameters={},
-            ),
-            preprocessed_benchmark_id=uuid.uuid4(),
-            status="pending",
-            created_at=datetime.now(),
-            started_at=None,
-            completed_at=None,
-            results=None,
-            failure_reason=None,
+        evaluation_id = EVALUATION_ID
+
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.create_evaluation.return_value = evaluation_id
+        mock_orchestrator.execute_evaluation.return_value = None
+        mock_orchestrator.list_evaluations.return_value = list(LISTED_EVALUATIONS[:1])
+
+        mock_progress_tracker = mock_container.progress_tracker.return_value
+        mock_progress_tracker.get_progress.return_value = {
+            "current": 100,
+            "total": 100,
+            "percentage": 100.0,
+            "status": "completed",
+        }
+
+        # Step 1: Create evaluation
+        create_result = runner.invoke(
+            cli,
+            [
+                "evaluate",
+                "create",
+                "--agent",
+                "cot",
+                "--model",
+                "anthropic/claude-3-sonnet",
+                "--benchmark",
+                "GPQA",
+            ],
         )
-
-        with patch("ml_agents_v2.cli.main.Container") as mock_container:
-            mock_orchestrator = Mock()
-            mock_orchestrator.create_evaluation.return_value = evaluation_id
-            mock_orchestrator.execute_evaluation.return_value = None
-            mock_orchestrator.list_evaluations.return_value = [
-                {
-                    "evaluation_id": evaluation_id,
-                    "status": "completed",
-                    "agent_type": "chain_of_thought",
-                    "model_name": "claude-3-sonnet",
-                    "benchmark_name": "GPQA",
-                    "accuracy": 97.5,
-                    "created_at": datetime.now(),
-                }
-            ]
-
-            mock_progress_tracker = Mock()
-            mock_progress_tracker.get_progress.return_value = {
-                "current": 100,
-                "total": 100,
-                "percentage": 100.0,
-                "status": "completed",
-            }
-
-            mock_container_instance = Mock()
-            mock_container_instance.evaluation_orchestrator.return_value = (
-                mock_orchestrator
-            )
-            mock_container_instance.progress_tracker.return_value = (
-                mock_progress_tracker
-            )
-            mock_container.return_value = mock_container_instance
-
-            # Step 1: Create evaluation
-            create_result = runner.invoke(
-                cli,
-                [
-                    "evaluate",
-                    "create",
-                    "--agent",
-                    "cot",
-                    "--model",
-                    "anthropic/claude-3-sonnet",
-                    "--benchmark",
-                    "GPQA",
-                ],
-            )
-            assert create_result.exit_code == 0
-            assert "✓ Created evaluation" in create_result.output
-
-            # Step 2: Run evaluation
-            run_result = runner.invoke(cli, ["evaluate", "run", str(evaluation_id)])
-            assert run_result.exit_code == 0
-
-            # Step 3: List evaluations
-            list_result = runner.invoke(cli, ["evaluate", "list"])
-            assert list_result.exit_code == 0
-            assert "completed" in list_result.output
-            assert "97.5%" in list_result.output
+        assert create_result.exit_code == 0
+        assert "✓ Created evaluation" in create_result.output
+
+        # Step 2: Run evaluation
+        run_result = runner.invoke(cli, ["evaluate", "run", str(evaluation_id)])
+        assert run_result.exit_code == 0
+
+        # Step 3: List evaluations
+        list_result = runner.invoke(cli, ["evaluate", "list"])
+        assert list_result.exit_code == 0
+        assert "completed" in list_result.output
+        assert "97.5%" in list_result.output
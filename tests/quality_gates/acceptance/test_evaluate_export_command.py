@@ -5,16 +5,20 @@ and tests the actual export functionality end-to-end.
 """
 
 import csv
-import tempfile
+import shutil
 import uuid
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
-from click.testing import CliRunner
+from sqlalchemy import event
 
 from ml_agents_v2.cli.main import cli
+from ml_agents_v2.core.application.services.evaluation_orchestrator import (
+    EvaluationOrchestrator,
+)
+from ml_agents_v2.core.application.services.exceptions import EvaluationNotFoundError
 from ml_agents_v2.core.domain.entities.evaluation import Evaluation
 from ml_agents_v2.core.domain.entities.evaluation_question_result import (
     EvaluationQuestionResult,
@@ -25,37 +29,70 @@ from ml_agents_v2.core.domain.entities.preprocessed_benchmark import (
 from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
 from ml_agents_v2.core.domain.value_objects.question import Question
 from ml_agents_v2.core.domain.value_objects.reasoning_trace import ReasoningTrace
+from ml_agents_v2.infrastructure.database.models.evaluation_question_result import (
+    EvaluationQuestionResultModel,
+)
 from ml_agents_v2.infrastructure.database.repositories.benchmark_repository_impl import (
     BenchmarkRepositoryImpl,
 )
+from ml_agents_v2.infrastructure.database.repositories.evaluation_question_result_repository_impl import (
+    EvaluationQuestionResultRepositoryImpl,
+)
 from ml_agents_v2.infrastructure.database.repositories.evaluation_repository_impl import (
     EvaluationRepositoryImpl,
 )
 from ml_agents_v2.infrastructure.database.session_manager import DatabaseSessionManager
+from ml_agents_v2.infrastructure.io.evaluation_results_csv_writer import (
+    EvaluationResultsCsvWriter,
+)
+
+# Timestamps are never asserted on, so every fixture shares one.
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _set_test_sqlite_pragmas(dbapi_connection, connection_record):
+    """Trade durability for speed on throwaway test databases."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
 class TestEvaluateExportCommand:
     """Test the evaluate export command with real data (no mocking core functionality)."""
 
+    @pytest.fixture(scope="class")
+    def template_db_path(self, tmp_path_factory):
+        """Create an empty database with all tables once per test class."""
+        db_path = tmp_path_factory.mktemp("template") / "template.db"
+        session_manager = DatabaseSessionManager(f"sqlite:///{db_path}")
+        session_manager.create_tables()
+        session_manager.engine.dispose()
+        return db_path
+
     @pytest.fixture
-    def temp_db_session_manager(self, tmp_path):
+    def temp_db_session_manager(self, tmp_path, template_db_path):
         """Create a temporary database with tables for testing."""
         db_path = tmp_path / "test_export.db"
+        shutil.copyfile(template_db_path, db_path)
         session_manager = DatabaseSessionManager(f"sqlite:///{db_path}")
-        session_manager.create_tables()
-        return session_manager
+        event.listen(session_manager.engine, "connect", _set_test_sqlite_pragmas)
+        yield session_manager
+        # Close pooled connections so SQLite checkpoints and drops -wal/-shm
+        session_manager.engine.dispose()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_evaluation_id(self):
         """Generate a test evaluation ID."""
         return uuid.uuid4()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_benchmark_id(self):
         """Generate a test benchmark ID."""
         return uuid.uuid4()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_evaluation(self, test_evaluation_id, test_benchmark_id):
         """Create a sample evaluation entity."""
         agent_config = AgentConfig(
@@ -71,14 +108,14 @@ class TestEvaluateExportCommand:
             agent_config=agent_config,
             preprocessed_benchmark_id=test_benchmark_id,
             status="completed",
-            created_at=datetime.now(),
-            started_at=datetime.now(),
-            completed_at=datetime.now(),
+            created_at=FROZEN_NOW,
+            started_at=FROZEN_NOW,
+            completed_at=FROZEN_NOW,
             results=None,
             failure_reason=None,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_benchmark(self, test_benchmark_id):
         """Create a sample benchmark entity."""
         questions = [
@@ -93,7 +130,7 @@ class TestEvaluateExportCommand:
             description="Test benchmark for export functionality",
             questions=questions,
             metadata={},
-            created_at=datetime.now(),
+            created_at=FROZEN_NOW,
             question_count=len(questions),
             format_version="1.0",
         )
@@ -121,7 +158,7 @@ class TestEvaluateExportCommand:
                 ),
                 error_message=None,
                 technical_details=None,
-                processed_at=datetime.now(),
+                processed_at=FROZEN_NOW,
             )
         )
 
@@ -143,7 +180,7 @@ class TestEvaluateExportCommand:
                 ),
                 error_message=None,
                 technical_details=None,
-                processed_at=datetime.now(),
+                processed_at=FROZEN_NOW,
             )
         )
 
@@ -161,7 +198,7 @@ class TestEvaluateExportCommand:
                 reasoning_trace=None,
                 error_message="Model timeout",
                 technical_details="Connection timed out after 30 seconds",
-                processed_at=datetime.now(),
+                processed_at=FROZEN_NOW,
             )
         )
 
@@ -169,11 +206,14 @@ class TestEvaluateExportCommand:
 
     def test_export_command_full_workflow(
         self,
+        runner,
         temp_db_session_manager,
         sample_evaluation,
         sample_benchmark,
         sample_question_results,
         test_evaluation_id,
+        mock_container,
+        tmp_path,
     ):
         """Test complete export workflow with real database operations."""
         # Setup: Create real data in test database
@@ -186,228 +226,169 @@ class TestEvaluateExportCommand:
         # Save evaluation
         evaluation_repo.save(sample_evaluation)
 
-        # Save question results directly to database
+        # Save question results directly to database (get_session commits)
+        question_result_models = [
+            EvaluationQuestionResultModel.from_domain(result)
+            for result in sample_question_results
+        ]
         with temp_db_session_manager.get_session() as session:
-            from ml_agents_v2.infrastructure.database.models.evaluation_question_result import (
-                EvaluationQuestionResultModel,
-            )
+            # One flush; the unit of work batches same-table INSERTs
+            session.add_all(question_result_models)
 
-            for result in sample_question_results:
-                model = EvaluationQuestionResultModel.from_domain(result)
-                session.add(model)
-            session.commit()
-
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            output_path = f.name
-
-        try:
-            runner = CliRunner()
-
-            # Mock the container to use our test database
-            with patch("ml_agents_v2.cli.main.Container") as mock_container:
-                # Import needed classes for proper mocking
-                # Create real orchestrator with test repositories and mocks for other dependencies
-                from unittest.mock import Mock
-
-                from ml_agents_v2.core.application.services.evaluation_orchestrator import (
-                    EvaluationOrchestrator,
-                )
-                from ml_agents_v2.infrastructure.database.repositories.evaluation_question_result_repository_impl import (
-                    EvaluationQuestionResultRepositoryImpl,
-                )
-                from ml_agents_v2.infrastructure.io.evaluation_results_csv_writer import (
-                    EvaluationResultsCsvWriter,
-                )
-
-                question_result_repo = EvaluationQuestionResultRepositoryImpl(
-                    temp_db_session_manager
-                )
-                export_service = EvaluationResultsCsvWriter()
-
-                mock_reasoning_service = Mock()
-                mock_domain_services = Mock()
-
-                test_orchestrator = EvaluationOrchestrator(
-                    evaluation_repository=evaluation_repo,
-                    evaluation_question_result_repository=question_result_repo,
-                    benchmark_repository=benchmark_repo,
-                    reasoning_infrastructure_service=mock_reasoning_service,
-                    domain_service_registry=mock_domain_services,
-                    export_service=export_service,
-                )
-
-                # Mock the container to return our test orchestrator
-                mock_container_instance = mock_container.return_value
-                mock_container_instance.evaluation_orchestrator.return_value = (
-                    test_orchestrator
-                )
-
-                # Execute the export command
-                short_id = str(test_evaluation_id)[:8]
-                result = runner.invoke(
-                    cli,
-                    [
-                        "evaluate",
-                        "export",
-                        short_id,
-                        "--format",
-                        "csv",
-                        "--output",
-                        output_path,
-                    ],
-                )
-
-                # Verify command succeeded
-                assert result.exit_code == 0, f"Command failed: {result.output}"
-                assert "✓ Exported" in result.output
-                assert short_id in result.output
-                assert output_path in result.output
-
-                # Verify CSV file was created and contains correct data
-                output_file = Path(output_path)
-                assert output_file.exists(), "Output CSV file was not created"
-
-                # Read and verify CSV contents
-                with open(output_path, newline="", encoding="utf-8") as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    rows = list(reader)
-
-                # Verify we have the correct number of rows
-                assert len(rows) == 3, f"Expected 3 rows, got {len(rows)}"
-
-                # Verify CSV headers
-                expected_headers = {
-                    "evaluation_id",
-                    "question_id",
-                    "question_text",
-                    "expected_answer",
-                    "actual_answer",
-                    "is_correct",
-                    "execution_time",
-                    "error_message",
-                    "processed_at",
-                }
-                assert set(rows[0].keys()) == expected_headers
-
-                # Verify specific row data
-                # Row 1: Correct answer
-                row1 = rows[0]
-                assert row1["question_id"] == "1"
-                assert row1["question_text"] == "What is 2+2?"
-                assert row1["expected_answer"] == "4"
-                assert row1["actual_answer"] == "4"
-                assert row1["is_correct"] == "True"
-                assert float(row1["execution_time"]) == 1.23
-                assert row1["error_message"] == ""
-
-                # Row 2: Incorrect answer
-                row2 = rows[1]
-                assert row2["question_id"] == "2"
-                assert row2["expected_answer"] == "6"
-                assert row2["actual_answer"] == "7"
-                assert row2["is_correct"] == "False"
-                assert float(row2["execution_time"]) == 2.45
-
-                # Row 3: Error case
-                row3 = rows[2]
-                assert row3["question_id"] == "3"
-                assert row3["actual_answer"] == ""
-                assert row3["is_correct"] == ""
-                assert row3["error_message"] == "Model timeout"
-                assert float(row3["execution_time"]) == 0.89
-
-        finally:
-            # Clean up temporary file
-            Path(output_path).unlink(missing_ok=True)
-
-    def test_export_command_evaluation_not_found(self):
-        """Test export command with non-existent evaluation ID."""
-        runner = CliRunner()
+        output_path = str(tmp_path / "out.csv")
 
-        # Use a non-existent evaluation ID
-        non_existent_id = "12345678"
+        # Create real orchestrator with test repositories and mocks for other dependencies
+        question_result_repo = EvaluationQuestionResultRepositoryImpl(
+            temp_db_session_manager
+        )
+        export_service = EvaluationResultsCsvWriter()
+
+        mock_reasoning_service = Mock()
+        mock_domain_services = Mock()
+
+        test_orchestrator = EvaluationOrchestrator(
+            evaluation_repository=evaluation_repo,
+            evaluation_question_result_repository=question_result_repo,
+            benchmark_repository=benchmark_repo,
+            reasoning_infrastructure_service=mock_reasoning_service,
+            domain_service_registry=mock_domain_services,
+            export_service=export_service,
+        )
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            output_path = f.name
-
-        try:
-            with patch("ml_agents_v2.cli.main.Container") as mock_container:
-                from ml_agents_v2.core.application.services.exceptions import (
-                    EvaluationNotFoundError,
-                )
-
-                # Mock orchestrator to raise exception
-                mock_orchestrator = (
-                    mock_container.return_value.evaluation_orchestrator.return_value
-                )
-                mock_orchestrator.export_evaluation_results.side_effect = (
-                    EvaluationNotFoundError(f"Evaluation {non_existent_id} not found")
-                )
-
-                result = runner.invoke(
-                    cli,
-                    [
-                        "evaluate",
-                        "export",
-                        non_existent_id,
-                        "--format",
-                        "csv",
-                        "--output",
-                        output_path,
-                    ],
-                )
-
-                # Verify command failed appropriately
-                assert result.exit_code == 1
-                assert "✗ Error" in result.output
-                assert non_existent_id in result.output
-
-        finally:
-            # Clean up temporary file
-            Path(output_path).unlink(missing_ok=True)
-
-    def test_export_command_invalid_format(self):
-        """Test export command with invalid format option."""
-        runner = CliRunner()
-
-        test_id = "12345678"
+        # Mock the container to return our test orchestrator
+        mock_container.evaluation_orchestrator.return_value = test_orchestrator
 
+        # Execute the export command
+        short_id = str(test_evaluation_id)[:8]
         result = runner.invoke(
             cli,
             [
                 "evaluate",
                 "export",
-                test_id,
+                short_id,
                 "--format",
-                "invalid_format",
+                "csv",
                 "--output",
-                "test.csv",
+                output_path,
             ],
         )
 
-        # Should fail due to invalid format choice
-        assert result.exit_code != 0
-        assert "Invalid value" in result.output or "invalid_format" in result.output
+        # Verify command succeeded
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        assert "✓ Exported" in result.output
+        assert short_id in result.output
+        assert output_path in result.output
+
+        # Verify CSV file was created and contains correct data
+        output_file = Path(output_path)
+        assert output_file.exists(), "Output CSV file was not created"
+
+        # Read and verify CSV contents
+        with open(output_path, newline="", encoding="utf-8") as csvfile:
+            reader = csv.DictReader(csvfile)
+            rows = list(reader)
+
+        # Verify we have the correct number of rows
+        assert len(rows) == 3, f"Expected 3 rows, got {len(rows)}"
+
+        # Verify CSV headers
+        expected_headers = {
+            "evaluation_id",
+            "question_id",
+            "question_text",
+            "expected_answer",
+            "actual_answer",
+            "is_correct",
+            "execution_time",
+            "error_message",
+            "processed_at",
+        }
+        assert set(rows[0].keys()) == expected_headers
+
+        # Verify specific row data
+        # Row 1: Correct answer
+        row1 = rows[0]
+        assert row1["question_id"] == "1"
+        assert row1["question_text"] == "What is 2+2?"
+        assert row1["expected_answer"] == "4"
+        assert row1["actual_answer"] == "4"
+        assert row1["is_correct"] == "True"
+        assert float(row1["execution_time"]) == 1.23
+        assert row1["error_message"] == ""
+
+        # Row 2: Incorrect answer
+        row2 = rows[1]
+        assert row2["question_id"] == "2"
+        assert row2["expected_answer"] == "6"
+        assert row2["actual_answer"] == "7"
+        assert row2["is_correct"] == "False"
+        assert float(row2["execution_time"]) == 2.45
+
+        # Row 3: Error case
+        row3 = rows[2]
+        assert row3["question_id"] == "3"
+        assert row3["actual_answer"] == ""
+        assert row3["is_correct"] == ""
+        assert row3["error_message"] == "Model timeout"
+        assert float(row3["execution_time"]) == 0.89
+
+    def test_export_command_evaluation_not_found(
+        self, runner, mock_container, tmp_path
+    ):
+        """Test export command with non-existent evaluation ID."""
+        # Use a non-existent evaluation ID
+        non_existent_id = "12345678"
 
-    def test_export_command_missing_output_file(self):
-        """Test export command without output file specified."""
-        runner = CliRunner()
+        output_path = str(tmp_path / "out.csv")
 
-        test_id = "12345678"
+        # Mock orchestrator to raise exception
+        mock_orchestrator = mock_container.evaluation_orchestrator.return_value
+        mock_orchestrator.export_evaluation_results.side_effect = (
+            EvaluationNotFoundError(f"Evaluation {non_existent_id} not found")
+        )
 
         result = runner.invoke(
             cli,
             [
                 "evaluate",
                 "export",
-                test_id,
+                non_existent_id,
                 "--format",
                 "csv",
-                # Missing --output parameter
+                "--output",
+                output_path,
             ],
         )
 
-        # Should fail due to missing required output parameter
+        # Verify command failed appropriately
+        assert result.exit_code == 1
+        assert "✗ Error" in result.output
+        assert non_existent_id in result.output
+
+
+class TestEvaluateExportArgValidation:
+    """Test export option validation, which Click rejects before any lookup."""
+
+    @pytest.mark.parametrize(
+        ("options", "expected_messages"),
+        [
+            pytest.param(
+                ["--format", "invalid_format", "--output", "test.csv"],
+                ("Invalid value", "invalid_format"),
+                id="invalid_format",
+            ),
+            pytest.param(
+                ["--format", "csv"],  # Missing --output parameter
+                ("Missing option", "required"),
+                id="missing_output_file",
+            ),
+        ],
+    )
+    def test_export_command_rejects_invalid_options(
+        self, runner, options, expected_messages
+    ):
+        """Test export command fails on invalid format or missing output file."""
+        result = runner.invoke(cli, ["evaluate", "export", "12345678", *options])
+
         assert result.exit_code != 0
-        assert "Missing option" in result.output or "required" in result.output
+        assert any(message in result.output for message in expected_messages)
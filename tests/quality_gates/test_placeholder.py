@@ -1,14 +0,0 @@
-"""Placeholder test to verify testing framework setup."""
-
-
-def test_placeholder() -> None:
-    """Placeholder test that always passes."""
-    assert True
-
-
-def test_python_version() -> None:
-    """Verify Python version requirements."""
-    import sys
-
-    # Ensure Python 3.9+
-    assert sys.version_info >= (3, 9), f"Python 3.9+ required, got {sys.version_info}"
@@ -10,14 +10,25 @@ from ml_agents_v2.core.domain.entities.evaluation import Evaluation
 from ml_agents_v2.core.domain.entities.preprocessed_benchmark import (
     PreprocessedBenchmark,
 )
+from ml_agents_v2.core.domain.repositories.evaluation_repository import (
+    EvaluationRepository,
+)
+from ml_agents_v2.core.domain.repositories.preprocessed_benchmark_repository import (
+    PreprocessedBenchmarkRepository,
+)
 from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
 from ml_agents_v2.core.domain.value_objects.answer import Answer
 from ml_agents_v2.core.domain.value_objects.evaluation_results import EvaluationResults
 from ml_agents_v2.core.domain.value_objects.question import Question
 from ml_agents_v2.core.domain.value_objects.reasoning_trace import ReasoningTrace
 
+# Deterministic ids and timestamps keep fixtures reproducible across runs
+FIXED_BENCHMARK_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+FIXED_EVALUATION_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 0, 0, 0)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_agent_config():
     """Create a sample agent configuration."""
     return AgentConfig(
@@ -29,7 +40,7 @@ def sample_agent_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_questions():
     """Create sample questions for testing."""
     return [
@@ -48,18 +59,18 @@ def sample_questions():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_benchmark(sample_questions):
     """Create a sample preprocessed benchmark."""
     return PreprocessedBenchmark(
-        benchmark_id=uuid.uuid4(),
+        benchmark_id=FIXED_BENCHMARK_ID,
         name="TEST_BENCHMARK",
         description="A test benchmark",
         format_version="1.0",
         questions=sample_questions,
         question_count=len(sample_questions),
         metadata={"category": "test"},
-        created_at=datetime.now(),
+        created_at=FIXED_TIMESTAMP,
     )
 
 
@@ -67,11 +78,11 @@ def sample_benchmark(sample_questions):
 def sample_evaluation(sample_agent_config, sample_benchmark):
     """Create a sample evaluation in pending state."""
     return Evaluation(
-        evaluation_id=uuid.uuid4(),
+        evaluation_id=FIXED_EVALUATION_ID,
         agent_config=sample_agent_config,
         preprocessed_benchmark_id=sample_benchmark.benchmark_id,
         status="pending",
-        created_at=datetime.now(),
+        created_at=FIXED_TIMESTAMP,
         started_at=None,
         completed_at=None,
         results=None,
@@ -79,7 +90,7 @@ def sample_evaluation(sample_agent_config, sample_benchmark):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evaluation_results():
     """Create sample evaluation results."""
     from ml_agents_v2.core.domain.value_objects.evaluation_results import QuestionResult
@@ -112,7 +123,7 @@ def sample_evaluation_results():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_answer():
     """Create a sample answer."""
     return Answer(
@@ -131,22 +142,19 @@ def sample_answer():
 @pytest.fixture
 def mock_evaluation_repository():
     """Create a mock evaluation repository."""
-    repo = Mock()
-    repo.save = Mock()
-    repo.get_by_id = Mock()
-    repo.update = Mock()
-    repo.list_all = Mock(return_value=[])
-    repo.list_by_status = Mock(return_value=[])
+    repo = Mock(spec=EvaluationRepository)
+    repo.list_all.return_value = []
+    repo.list_by_status.return_value = []
     return repo
 
 
 @pytest.fixture
 def mock_benchmark_repository(sample_benchmark):
     """Create a mock benchmark repository."""
-    repo = Mock()
-    repo.get_by_name = Mock(return_value=sample_benchmark)
-    repo.get_by_id = Mock(return_value=sample_benchmark)
-    repo.list_all = Mock(return_value=[sample_benchmark])
+    repo = Mock(spec=PreprocessedBenchmarkRepository)
+    repo.get_by_name.return_value = sample_benchmark
+    repo.get_by_id.return_value = sample_benchmark
+    repo.list_all.return_value = [sample_benchmark]
     return repo
 
 
@@ -0,0 +1,184 @@
+"""Unit tests for concurrent question execution in EvaluationOrchestrator."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from ml_agents_v2.core.application.services.evaluation_orchestrator import (
+    EvaluationOrchestrator,
+)
+
+
+class TestConcurrentQuestionExecution:
+    """Test that questions are dispatched concurrently up to the configured limit."""
+
+    @pytest.fixture
+    def question_result_repo(self):
+        """Create question result repository with no completed questions."""
+        repo = Mock()
+        repo.exists.return_value = False
+        return repo
+
+    @pytest.fixture
+    def tracking_reasoning_service(self, sample_answer):
+        """Create reasoning service that records peak concurrency."""
+
+        class TrackingReasoningService:
+            def __init__(self):
+                self.in_flight = 0
+                self.peak = 0
+                self.calls = []
+
+            async def execute_reasoning(self, domain_service, question, config):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                self.calls.append(question.id)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                return sample_answer
+
+        return TrackingReasoningService()
+
+    def _create_orchestrator(
+        self,
+        question_result_repo,
+        reasoning_service,
+        max_concurrent_questions,
+    ):
+        return EvaluationOrchestrator(
+            evaluation_repository=Mock(),
+            evaluation_question_result_repository=question_result_repo,
+            benchmark_repository=Mock(),
+            reasoning_infrastructure_service=reasoning_service,
+            domain_service_registry={"chain_of_thought": Mock()},
+            export_service=Mock(),
+            max_concurrent_questions=max_concurrent_questions,
+        )
+
+    @pytest.mark.parametrize("limit,expected_peak", [(1, 1), (2, 2), (16, 2)])
+    async def test_questions_respect_concurrency_limit(
+        self,
+        sample_evaluation,
+        sample_benchmark,
+        question_result_repo,
+        tracking_reasoning_service,
+        limit,
+        expected_peak,
+    ):
+        """Test in-flight questions never exceed max_concurrent_questions."""
+        orchestrator = self._create_orchestrator(
+            question_result_repo, tracking_reasoning_service, limit
+        )
+
+        await orchestrator._execute_questions_incrementally(
+            sample_evaluation, sample_benchmark, None
+        )
+
+        assert tracking_reasoning_service.peak == expected_peak
+        assert question_result_repo.save.call_count == len(sample_benchmark.questions)
+
+    async def test_completed_questions_are_skipped(
+        self,
+        sample_evaluation,
+        sample_benchmark,
+        question_result_repo,
+        tracking_reasoning_service,
+    ):
+        """Test questions with saved results are not dispatched again."""
+        question_result_repo.exists.side_effect = (
+            lambda evaluation_id, question_id: question_id == "q1"
+        )
+        orchestrator = self._create_orchestrator(
+            question_result_repo, tracking_reasoning_service, 4
+        )
+
+        await orchestrator._execute_questions_incrementally(
+            sample_evaluation, sample_benchmark, None
+        )
+
+        assert tracking_reasoning_service.calls == ["q2"]
+        assert question_result_repo.save.call_count == 1
+
+
+class TestConcurrentQuestionCancellation:
+    """Test that a failing or cancelled run stops every in-flight question."""
+
+    @pytest.fixture
+    def blocking_reasoning_service(self):
+        """Create reasoning service whose calls block until cancelled."""
+
+        class BlockingReasoningService:
+            def __init__(self):
+                self.started = []
+                self.cancelled = []
+                self.fail_question_id = None
+
+            async def execute_reasoning(self, domain_service, question, config):
+                self.started.append(question.id)
+                if question.id == self.fail_question_id:
+                    raise ValueError("model unavailable")
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    self.cancelled.append(question.id)
+                    raise
+
+        return BlockingReasoningService()
+
+    def _create_orchestrator(self, question_result_repo, reasoning_service):
+        return EvaluationOrchestrator(
+            evaluation_repository=Mock(),
+            evaluation_question_result_repository=question_result_repo,
+            benchmark_repository=Mock(),
+            reasoning_infrastructure_service=reasoning_service,
+            domain_service_registry={"chain_of_thought": Mock()},
+            export_service=Mock(),
+            max_concurrent_questions=2,
+        )
+
+    async def test_failure_cancels_sibling_questions(
+        self, sample_evaluation, sample_benchmark, blocking_reasoning_service
+    ):
+        """Test an error escaping one question cancels the others and propagates."""
+        # The failed result cannot be saved, so the error leaves the question
+        question_result_repo = Mock()
+        question_result_repo.exists.return_value = False
+        question_result_repo.save.side_effect = RuntimeError("database unavailable")
+        blocking_reasoning_service.fail_question_id = "q2"
+        orchestrator = self._create_orchestrator(
+            question_result_repo, blocking_reasoning_service
+        )
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            await orchestrator._execute_questions_incrementally(
+                sample_evaluation, sample_benchmark, None
+            )
+
+        assert blocking_reasoning_service.cancelled == ["q1"]
+
+    async def test_cancellation_stops_all_questions(
+        self, sample_evaluation, sample_benchmark, blocking_reasoning_service
+    ):
+        """Test cancelling the run cancels every in-flight question."""
+        question_result_repo = Mock()
+        question_result_repo.exists.return_value = False
+        orchestrator = self._create_orchestrator(
+            question_result_repo, blocking_reasoning_service
+        )
+
+        run = asyncio.ensure_future(
+            orchestrator._execute_questions_incrementally(
+                sample_evaluation, sample_benchmark, None
+            )
+        )
+        # Let both questions start before interrupting the run
+        while len(blocking_reasoning_service.started) < 2:
+            await asyncio.sleep(0)
+        run.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        assert sorted(blocking_reasoning_service.cancelled) == ["q1", "q2"]
+        question_result_repo.save.assert_not_called()
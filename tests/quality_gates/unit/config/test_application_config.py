@@ -46,6 +46,20 @@ class TestApplicationConfig:
             with pytest.raises(ValidationError, match="Field required"):
                 ApplicationConfig(_env_file=None)
 
+    @pytest.mark.parametrize("value", ["0", "-1"])
+    def test_config_rejects_non_positive_question_concurrency(self, value):
+        """Test that MAX_CONCURRENT_QUESTIONS below 1 fails at load time."""
+        with patch.dict(
+            os.environ,
+            {
+                "OPENROUTER_API_KEY": "sk-or-v1-test-key",
+                "MAX_CONCURRENT_QUESTIONS": value,
+            },
+            clear=True,
+        ):
+            with pytest.raises(ValidationError, match="max_concurrent_questions"):
+                ApplicationConfig(_env_file=None)
+
     def test_config_loads_agent_defaults(self):
         """Test that ApplicationConfig loads agent default parameters."""
         with patch.dict(
@@ -0,0 +1,84 @@
+"""Shared fixtures for domain unit tests.
+
+Value objects (reasoning traces, agent config) are frozen and shared for the
+whole session. The question result entities are frozen dataclasses too, but
+are module-scoped so each test module builds its own.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from ml_agents_v2.core.domain.entities.evaluation_question_result import (
+    EvaluationQuestionResult,
+)
+from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
+from ml_agents_v2.core.domain.value_objects.reasoning_trace import ReasoningTrace
+
+
+@pytest.fixture(scope="session")
+def fixed_now() -> datetime:
+    """Fixed timestamp for entities whose tests do not inspect time."""
+    return datetime(2024, 1, 1, 0, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def empty_reasoning_trace() -> ReasoningTrace:
+    """Empty reasoning trace produced by the 'none' approach."""
+    return ReasoningTrace(approach_type="none", reasoning_text="", metadata={})
+
+
+@pytest.fixture(scope="session")
+def cot_reasoning_trace() -> ReasoningTrace:
+    """Chain-of-thought reasoning trace with step-by-step text."""
+    return ReasoningTrace(
+        approach_type="chain_of_thought",
+        reasoning_text="Step-by-step reasoning",
+        metadata={"confidence": 0.8},
+    )
+
+
+@pytest.fixture(scope="session")
+def default_agent_config() -> AgentConfig:
+    """Direct-answer agent configuration for GPT-4."""
+    return AgentConfig(
+        agent_type="none",
+        model_provider="openai",
+        model_name="gpt-4",
+        model_parameters={},
+        agent_parameters={},
+    )
+
+
+@pytest.fixture(scope="module")
+def question_results_by_outcome() -> dict[str, EvaluationQuestionResult]:
+    """One question result per outcome: correct, incorrect and failed."""
+    return {
+        "correct": EvaluationQuestionResult.create_successful(
+            evaluation_id=uuid.uuid4(),
+            question_id="q1",
+            question_text="Test",
+            expected_answer="Test",
+            actual_answer="Test",
+            is_correct=True,
+            execution_time=1.0,
+        ),
+        "incorrect": EvaluationQuestionResult.create_successful(
+            evaluation_id=uuid.uuid4(),
+            question_id="q2",
+            question_text="Test",
+            expected_answer="Test",
+            actual_answer="Wrong",
+            is_correct=False,
+            execution_time=1.0,
+        ),
+        "failed": EvaluationQuestionResult.create_failed(
+            evaluation_id=uuid.uuid4(),
+            question_id="q3",
+            question_text="Test",
+            expected_answer="Test",
+            error_message="Error",
+            execution_time=1.0,
+        ),
+    }
@@ -145,3 +145,16 @@ class TestAgentConfig:
         # Should not be able to modify dictionary contents
         with pytest.raises(TypeError):
             config.model_parameters["temperature"] = 0.5  # type: ignore
+
+    def test_agent_config_qualified_model_name(self) -> None:
+        """Test provider-qualified model name is built once and reused."""
+        config = AgentConfig(
+            agent_type="none",
+            model_provider="openrouter",
+            model_name="gpt-4",
+            model_parameters={},
+            agent_parameters={},
+        )
+
+        assert config.qualified_model_name == "openrouter/gpt-4"
+        assert config.qualified_model_name is config.qualified_model_name
@@ -1,5 +1,9 @@
 """Tests for Answer value object."""
 
+from typing import Any
+
+import pytest
+
 from ml_agents_v2.core.domain.value_objects.answer import Answer
 from ml_agents_v2.core.domain.value_objects.reasoning_trace import ReasoningTrace
 
@@ -7,37 +11,29 @@ from ml_agents_v2.core.domain.value_objects.reasoning_trace import ReasoningTrac
 class TestAnswer:
     """Test suite for Answer value object."""
 
-    def test_answer_creation(self) -> None:
+    def test_answer_creation(self, cot_reasoning_trace: ReasoningTrace) -> None:
         """Test Answer can be created with all attributes."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="chain_of_thought",
-            reasoning_text="Step 1: Analyze the problem...",
-            metadata={},
-        )
-
         answer = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=cot_reasoning_trace,
             confidence=0.95,
             execution_time=2.5,
             raw_response="Let me think step by step... The answer is 42.",
         )
 
         assert answer.extracted_answer == "42"
-        assert answer.reasoning_trace == reasoning_trace
+        assert answer.reasoning_trace == cot_reasoning_trace
         assert answer.confidence == 0.95
         assert answer.execution_time == 2.5
         assert answer.raw_response == "Let me think step by step... The answer is 42."
 
-    def test_answer_creation_with_none_confidence(self) -> None:
+    def test_answer_creation_with_none_confidence(
+        self, empty_reasoning_trace: ReasoningTrace
+    ) -> None:
         """Test Answer can be created with None confidence."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
         answer = Answer(
             extracted_answer="Yes",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=None,
             execution_time=1.0,
             raw_response="Yes",
@@ -45,22 +41,18 @@ class TestAnswer:
 
         assert answer.confidence is None
 
-    def test_answer_value_equality(self) -> None:
+    def test_answer_value_equality(self, empty_reasoning_trace: ReasoningTrace) -> None:
         """Test Answer equality based on values."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
         answer1 = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=0.9,
             execution_time=1.5,
             raw_response="The answer is 42",
         )
         answer2 = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=0.9,
             execution_time=1.5,
             raw_response="The answer is 42",
@@ -68,22 +60,20 @@ class TestAnswer:
 
         assert answer1 == answer2
 
-    def test_answer_value_inequality(self) -> None:
+    def test_answer_value_inequality(
+        self, empty_reasoning_trace: ReasoningTrace
+    ) -> None:
         """Test Answer inequality when values differ."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
         answer1 = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=0.9,
             execution_time=1.5,
             raw_response="The answer is 42",
         )
         answer2 = Answer(
             extracted_answer="24",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=0.9,
             execution_time=1.5,
             raw_response="The answer is 24",
@@ -91,109 +81,69 @@ class TestAnswer:
 
         assert answer1 != answer2
 
-    def test_answer_validation_empty_extracted_answer(self) -> None:
-        """Test Answer validation fails for empty extracted_answer."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
-        try:
-            Answer(
-                extracted_answer="",
-                reasoning_trace=reasoning_trace,
-                confidence=None,
-                execution_time=1.0,
-                raw_response="Response",
-            )
-            raise AssertionError("Expected ValueError for empty extracted_answer")
-        except ValueError as e:
-            assert "Extracted answer cannot be empty" in str(e)
-
-    def test_answer_validation_negative_execution_time(self) -> None:
-        """Test Answer validation fails for negative execution_time."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
-        try:
-            Answer(
-                extracted_answer="42",
-                reasoning_trace=reasoning_trace,
-                confidence=None,
-                execution_time=-1.0,
-                raw_response="Response",
-            )
-            raise AssertionError("Expected ValueError for negative execution_time")
-        except ValueError as e:
-            assert "Execution time cannot be negative" in str(e)
-
-    def test_answer_validation_invalid_confidence_range(self) -> None:
-        """Test Answer validation fails for confidence outside [0,1] range."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
-        try:
-            Answer(
-                extracted_answer="42",
-                reasoning_trace=reasoning_trace,
-                confidence=1.5,
-                execution_time=1.0,
-                raw_response="Response",
-            )
-            raise AssertionError("Expected ValueError for confidence > 1")
-        except ValueError as e:
-            assert "Confidence must be between 0 and 1" in str(e)
-
-    def test_answer_validation_empty_raw_response(self) -> None:
-        """Test Answer validation fails for empty raw_response."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
-        try:
-            Answer(
-                extracted_answer="42",
-                reasoning_trace=reasoning_trace,
-                confidence=None,
-                execution_time=1.0,
-                raw_response="",
-            )
-            raise AssertionError("Expected ValueError for empty raw_response")
-        except ValueError as e:
-            assert "Raw response cannot be empty" in str(e)
-
-    def test_answer_immutability(self) -> None:
+    @pytest.mark.parametrize(
+        ("overrides", "message"),
+        [
+            pytest.param(
+                {"extracted_answer": ""},
+                "Extracted answer cannot be empty",
+                id="empty_extracted_answer",
+            ),
+            pytest.param(
+                {"execution_time": -1.0},
+                "Execution time cannot be negative",
+                id="negative_execution_time",
+            ),
+            pytest.param(
+                {"confidence": 1.5},
+                "Confidence must be between 0 and 1",
+                id="confidence_out_of_range",
+            ),
+            pytest.param(
+                {"raw_response": ""},
+                "Raw response cannot be empty",
+                id="empty_raw_response",
+            ),
+        ],
+    )
+    def test_answer_validation(
+        self,
+        empty_reasoning_trace: ReasoningTrace,
+        overrides: dict[str, Any],
+        message: str,
+    ) -> None:
+        """Test Answer validation rejects each invalid attribute."""
+        fields: dict[str, Any] = {
+            "extracted_answer": "42",
+            "reasoning_trace": empty_reasoning_trace,
+            "confidence": None,
+            "execution_time": 1.0,
+            "raw_response": "Response",
+            **overrides,
+        }
+
+        with pytest.raises(ValueError, match=message):
+            Answer(**fields)
+
+    def test_answer_immutability(self, empty_reasoning_trace: ReasoningTrace) -> None:
         """Test Answer is immutable."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
         answer = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=0.9,
             execution_time=1.5,
             raw_response="The answer is 42",
         )
 
-        try:
+        # Frozen dataclass should prevent modification
+        with pytest.raises((AttributeError, ValueError)):
             answer.extracted_answer = "24"  # type: ignore
-            raise AssertionError(
-                "Expected error when trying to modify extracted_answer"
-            )
-        except (AttributeError, ValueError):
-            pass  # Expected - frozen dataclass should prevent modification
 
-    def test_answer_has_confidence(self) -> None:
+    def test_answer_has_confidence(self, empty_reasoning_trace: ReasoningTrace) -> None:
         """Test has_confidence method returns correct value."""
-        reasoning_trace = ReasoningTrace(
-            approach_type="none", reasoning_text="", metadata={}
-        )
-
         answer_with_confidence = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=0.9,
             execution_time=1.5,
             raw_response="Response",
@@ -201,7 +151,7 @@ class TestAnswer:
 
         answer_without_confidence = Answer(
             extracted_answer="42",
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=empty_reasoning_trace,
             confidence=None,
             execution_time=1.5,
             raw_response="Response",
@@ -14,14 +14,9 @@ from ml_agents_v2.core.domain.value_objects.reasoning_trace import ReasoningTrac
 class TestEvaluationQuestionResult:
     """Test suite for EvaluationQuestionResult entity."""
 
-    def test_create_successful(self) -> None:
+    def test_create_successful(self, cot_reasoning_trace: ReasoningTrace) -> None:
         """Test creating successful EvaluationQuestionResult."""
         evaluation_id = uuid.uuid4()
-        reasoning_trace = ReasoningTrace(
-            approach_type="chain_of_thought",
-            reasoning_text="Step-by-step reasoning",
-            metadata={"confidence": 0.8},
-        )
 
         result = EvaluationQuestionResult.create_successful(
             evaluation_id=evaluation_id,
@@ -31,7 +26,7 @@ class TestEvaluationQuestionResult:
             actual_answer="4",
             is_correct=True,
             execution_time=1.5,
-            reasoning_trace=reasoning_trace,
+            reasoning_trace=cot_reasoning_trace,
         )
 
         assert result.evaluation_id == evaluation_id
@@ -41,7 +36,7 @@ class TestEvaluationQuestionResult:
         assert result.actual_answer == "4"
         assert result.is_correct is True
         assert result.execution_time == 1.5
-        assert result.reasoning_trace == reasoning_trace
+        assert result.reasoning_trace == cot_reasoning_trace
         assert result.error_message is None
         assert result.technical_details is None
         assert result.processed_at is not None
@@ -103,101 +98,62 @@ class TestEvaluationQuestionResult:
                 execution_time=-1.0,
             )
 
-    def test_validation_missing_error_message_on_failure(self) -> None:
-        """Test validation fails when both actual_answer and error_message are None."""
-        with pytest.raises(
-            ValueError, match="Error message required if processing failed"
-        ):
+    @pytest.mark.parametrize(
+        ("actual_answer", "message"),
+        [
+            pytest.param(
+                None,
+                "Error message required if processing failed",
+                id="missing_error_message_on_failure",
+            ),
+            pytest.param(
+                "Test",
+                "Successful processing must have correctness evaluation",
+                id="missing_correctness_on_success",
+            ),
+        ],
+    )
+    def test_validation_incomplete_outcome(
+        self, fixed_now: datetime, actual_answer: str | None, message: str
+    ) -> None:
+        """Test validation fails when neither outcome is fully recorded.
+
+        A result without an answer needs an error message, and a result with
+        an answer needs its correctness evaluated.
+        """
+        with pytest.raises(ValueError, match=message):
             EvaluationQuestionResult(
                 id=uuid.uuid4(),
                 evaluation_id=uuid.uuid4(),
                 question_id="q1",
                 question_text="Test",
                 expected_answer="Test",
-                actual_answer=None,
+                actual_answer=actual_answer,
                 is_correct=None,
                 execution_time=1.0,
                 reasoning_trace=None,
                 error_message=None,
                 technical_details=None,
-                processed_at=datetime.now(),
+                processed_at=fixed_now,
             )
 
-    def test_validation_missing_correctness_on_success(self) -> None:
-        """Test validation fails when actual_answer exists but is_correct is None."""
-        with pytest.raises(
-            ValueError, match="Successful processing must have correctness evaluation"
-        ):
-            EvaluationQuestionResult(
-                id=uuid.uuid4(),
-                evaluation_id=uuid.uuid4(),
-                question_id="q1",
-                question_text="Test",
-                expected_answer="Test",
-                actual_answer="Test",
-                is_correct=None,
-                execution_time=1.0,
-                reasoning_trace=None,
-                error_message=None,
-                technical_details=None,
-                processed_at=datetime.now(),
-            )
-
-    def test_is_successful(self) -> None:
-        """Test is_successful method."""
-        successful_result = EvaluationQuestionResult.create_successful(
-            evaluation_id=uuid.uuid4(),
-            question_id="q1",
-            question_text="Test",
-            expected_answer="Test",
-            actual_answer="Test",
-            is_correct=True,
-            execution_time=1.0,
-        )
-
-        failed_result = EvaluationQuestionResult.create_failed(
-            evaluation_id=uuid.uuid4(),
-            question_id="q2",
-            question_text="Test",
-            expected_answer="Test",
-            error_message="Error",
-            execution_time=1.0,
-        )
-
-        assert successful_result.is_successful() is True
-        assert failed_result.is_successful() is False
-
-    def test_matches_expected(self) -> None:
-        """Test matches_expected method."""
-        correct_result = EvaluationQuestionResult.create_successful(
-            evaluation_id=uuid.uuid4(),
-            question_id="q1",
-            question_text="Test",
-            expected_answer="Test",
-            actual_answer="Test",
-            is_correct=True,
-            execution_time=1.0,
-        )
-
-        incorrect_result = EvaluationQuestionResult.create_successful(
-            evaluation_id=uuid.uuid4(),
-            question_id="q2",
-            question_text="Test",
-            expected_answer="Test",
-            actual_answer="Wrong",
-            is_correct=False,
-            execution_time=1.0,
-        )
-
-        failed_result = EvaluationQuestionResult.create_failed(
-            evaluation_id=uuid.uuid4(),
-            question_id="q3",
-            question_text="Test",
-            expected_answer="Test",
-            error_message="Error",
-            execution_time=1.0,
-        )
-
-        assert correct_result.matches_expected() is True
-        assert incorrect_result.matches_expected() is False
-        assert failed_result.matches_expected() is False
+    @pytest.mark.parametrize(
+        ("outcome", "successful", "matches"),
+        [
+            ("correct", True, True),
+            ("incorrect", True, False),
+            ("failed", False, False),
+        ],
+    )
+    def test_outcome_predicates(
+        self,
+        question_results_by_outcome: dict[str, EvaluationQuestionResult],
+        outcome: str,
+        successful: bool,
+        matches: bool,
+    ) -> None:
+        """Test is_successful and matches_expected for each outcome."""
+        result = question_results_by_outcome[outcome]
+
+        assert result.is_successful() is successful
+        assert result.matches_expected() is matches
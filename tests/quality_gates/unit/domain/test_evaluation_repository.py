@@ -1,6 +1,8 @@
 """Tests for EvaluationRepository interface."""
 
 import uuid
+from collections import defaultdict
+from dataclasses import replace
 from datetime import datetime
 
 import pytest
@@ -11,6 +13,9 @@ from ml_agents_v2.core.domain.repositories.evaluation_repository import (
 )
 from ml_agents_v2.core.domain.value_objects.agent_config import AgentConfig
 
+# The in-memory repository holds no loop-bound state, so one loop serves all
+_SHARED_LOOP = pytest.mark.asyncio(loop_scope="module")
+
 
 class MockEvaluationRepository(EvaluationRepository):
     """Mock implementation of EvaluationRepository for testing."""
@@ -18,10 +23,31 @@ class MockEvaluationRepository(EvaluationRepository):
     def __init__(self) -> None:
         """Initialize mock repository with empty storage."""
         self._evaluations: dict[uuid.UUID, Evaluation] = {}
+        # Secondary indexes so filtered lookups touch only matching ids
+        self._by_status: defaultdict[str, set[uuid.UUID]] = defaultdict(set)
+        self._by_benchmark: defaultdict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+
+    def _index(self, evaluation: Evaluation) -> None:
+        """Add evaluation to the secondary indexes."""
+        self._by_status[evaluation.status].add(evaluation.evaluation_id)
+        self._by_benchmark[evaluation.preprocessed_benchmark_id].add(
+            evaluation.evaluation_id
+        )
+
+    def _unindex(self, evaluation: Evaluation) -> None:
+        """Remove evaluation from the secondary indexes."""
+        self._by_status[evaluation.status].discard(evaluation.evaluation_id)
+        self._by_benchmark[evaluation.preprocessed_benchmark_id].discard(
+            evaluation.evaluation_id
+        )
 
     async def save(self, evaluation: Evaluation) -> None:
         """Mock save implementation."""
+        existing = self._evaluations.get(evaluation.evaluation_id)
+        if existing is not None:
+            self._unindex(existing)
         self._evaluations[evaluation.evaluation_id] = evaluation
+        self._index(evaluation)
 
     async def get_by_id(self, evaluation_id: uuid.UUID) -> Evaluation | None:
         """Mock get_by_id implementation."""
@@ -29,31 +55,25 @@ class MockEvaluationRepository(EvaluationRepository):
 
     async def list_by_status(self, status: str) -> list[Evaluation]:
         """Mock list_by_status implementation."""
-        return [
-            eval_obj
-            for eval_obj in self._evaluations.values()
-            if eval_obj.status == status
-        ]
+        return [self._evaluations[i] for i in self._by_status.get(status, ())]
 
     async def list_by_benchmark_id(self, benchmark_id: uuid.UUID) -> list[Evaluation]:
         """Mock list_by_benchmark_id implementation."""
-        return [
-            eval_obj
-            for eval_obj in self._evaluations.values()
-            if eval_obj.preprocessed_benchmark_id == benchmark_id
-        ]
+        return [self._evaluations[i] for i in self._by_benchmark.get(benchmark_id, ())]
 
     async def update(self, evaluation: Evaluation) -> None:
         """Mock update implementation."""
         if evaluation.evaluation_id not in self._evaluations:
             raise ValueError(f"Evaluation {evaluation.evaluation_id} not found")
+        self._unindex(self._evaluations[evaluation.evaluation_id])
         self._evaluations[evaluation.evaluation_id] = evaluation
+        self._index(evaluation)
 
     async def delete(self, evaluation_id: uuid.UUID) -> None:
         """Mock delete implementation."""
         if evaluation_id not in self._evaluations:
             raise ValueError(f"Evaluation {evaluation_id} not found")
-        del self._evaluations[evaluation_id]
+        self._unindex(self._evaluations.pop(evaluation_id))
 
     async def exists(self, evaluation_id: uuid.UUID) -> bool:
         """Mock exists implementation."""
@@ -76,29 +96,23 @@ class TestEvaluationRepository:
         return MockEvaluationRepository()
 
     @pytest.fixture
-    def sample_evaluation(self) -> Evaluation:
-        """Create a sample evaluation for testing."""
-        agent_config = AgentConfig(
-            agent_type="none",
-            model_provider="openai",
-            model_name="gpt-4",
-            model_parameters={"temperature": 0.7},
-            agent_parameters={},
-        )
-
+    def sample_evaluation(
+        self, default_agent_config: AgentConfig, fixed_now: datetime
+    ) -> Evaluation:
+        """Create a pending evaluation; list tests copy it with dataclasses.replace."""
         return Evaluation(
             evaluation_id=uuid.uuid4(),
-            agent_config=agent_config,
+            agent_config=default_agent_config,
             preprocessed_benchmark_id=uuid.uuid4(),
             status="pending",
-            created_at=datetime.now(),
+            created_at=fixed_now,
             started_at=None,
             completed_at=None,
             results=None,
             failure_reason=None,
         )
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_save_evaluation(
         self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
     ) -> None:
@@ -109,7 +123,7 @@ class TestEvaluationRepository:
         retrieved = await repository.get_by_id(sample_evaluation.evaluation_id)
         assert retrieved == sample_evaluation
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_get_by_id_existing(
         self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
     ) -> None:
@@ -121,7 +135,7 @@ class TestEvaluationRepository:
         assert result == sample_evaluation
         assert result.evaluation_id == sample_evaluation.evaluation_id
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_get_by_id_nonexistent(
         self, repository: MockEvaluationRepository
     ) -> None:
@@ -132,40 +146,21 @@ class TestEvaluationRepository:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_list_by_status(self, repository: MockEvaluationRepository) -> None:
+    @_SHARED_LOOP
+    async def test_list_by_status(
+        self,
+        repository: MockEvaluationRepository,
+        sample_evaluation: Evaluation,
+    ) -> None:
         """Test listing evaluations by status."""
         # Create evaluations with different statuses
-        agent_config = AgentConfig(
-            agent_type="none",
-            model_provider="openai",
-            model_name="gpt-4",
-            model_parameters={},
-            agent_parameters={},
-        )
+        pending_eval = replace(sample_evaluation, evaluation_id=uuid.uuid4())
 
-        pending_eval = Evaluation(
+        running_eval = replace(
+            sample_evaluation,
             evaluation_id=uuid.uuid4(),
-            agent_config=agent_config,
-            preprocessed_benchmark_id=uuid.uuid4(),
-            status="pending",
-            created_at=datetime.now(),
-            started_at=None,
-            completed_at=None,
-            results=None,
-            failure_reason=None,
-        )
-
-        running_eval = Evaluation(
-            evaluation_id=uuid.uuid4(),
-            agent_config=agent_config,
-            preprocessed_benchmark_id=uuid.uuid4(),
             status="running",
-            created_at=datetime.now(),
-            started_at=datetime.now(),
-            completed_at=None,
-            results=None,
-            failure_reason=None,
+            started_at=sample_evaluation.created_at,
         )
 
         await repository.save(pending_eval)
@@ -182,56 +177,34 @@ class TestEvaluationRepository:
         assert running_evals[0] == running_eval
         assert len(completed_evals) == 0
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_list_by_benchmark_id(
-        self, repository: MockEvaluationRepository
+        self,
+        repository: MockEvaluationRepository,
+        sample_evaluation: Evaluation,
     ) -> None:
         """Test listing evaluations by benchmark ID."""
         benchmark_id_1 = uuid.uuid4()
         benchmark_id_2 = uuid.uuid4()
 
-        agent_config = AgentConfig(
-            agent_type="none",
-            model_provider="openai",
-            model_name="gpt-4",
-            model_parameters={},
-            agent_parameters={},
-        )
-
-        eval_1 = Evaluation(
+        eval_1 = replace(
+            sample_evaluation,
             evaluation_id=uuid.uuid4(),
-            agent_config=agent_config,
             preprocessed_benchmark_id=benchmark_id_1,
-            status="pending",
-            created_at=datetime.now(),
-            started_at=None,
-            completed_at=None,
-            results=None,
-            failure_reason=None,
         )
 
-        eval_2 = Evaluation(
+        eval_2 = replace(
+            sample_evaluation,
             evaluation_id=uuid.uuid4(),
-            agent_config=agent_config,
             preprocessed_benchmark_id=benchmark_id_1,
             status="running",
-            created_at=datetime.now(),
-            started_at=datetime.now(),
-            completed_at=None,
-            results=None,
-            failure_reason=None,
+            started_at=sample_evaluation.created_at,
         )
 
-        eval_3 = Evaluation(
+        eval_3 = replace(
+            sample_evaluation,
             evaluation_id=uuid.uuid4(),
-            agent_config=agent_config,
             preprocessed_benchmark_id=benchmark_id_2,
-            status="pending",
-            created_at=datetime.now(),
-            started_at=None,
-            completed_at=None,
-            results=None,
-            failure_reason=None,
         )
 
         await repository.save(eval_1)
@@ -248,7 +221,7 @@ class TestEvaluationRepository:
         assert len(benchmark_2_evals) == 1
         assert eval_3 in benchmark_2_evals
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_update_evaluation(
         self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
     ) -> None:
@@ -264,7 +237,22 @@ class TestEvaluationRepository:
         assert retrieved.status == "running"
         assert retrieved.started_at is not None
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
+    async def test_list_by_status_reflects_update(
+        self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
+    ) -> None:
+        """Test status listings follow an evaluation through an update."""
+        await repository.save(sample_evaluation)
+
+        await repository.update(sample_evaluation.start_execution())
+
+        assert await repository.list_by_status("pending") == []
+        running_evals = await repository.list_by_status("running")
+        assert [e.evaluation_id for e in running_evals] == [
+            sample_evaluation.evaluation_id
+        ]
+
+    @_SHARED_LOOP
     async def test_update_nonexistent_evaluation(
         self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
     ) -> None:
@@ -272,7 +260,7 @@ class TestEvaluationRepository:
         with pytest.raises(ValueError, match="not found"):
             await repository.update(sample_evaluation)
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_delete_evaluation(
         self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
     ) -> None:
@@ -289,7 +277,7 @@ class TestEvaluationRepository:
         assert await repository.exists(sample_evaluation.evaluation_id) is False
         assert await repository.get_by_id(sample_evaluation.evaluation_id) is None
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_delete_nonexistent_evaluation(
         self, repository: MockEvaluationRepository
     ) -> None:
@@ -299,7 +287,7 @@ class TestEvaluationRepository:
         with pytest.raises(ValueError, match="not found"):
             await repository.delete(nonexistent_id)
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_exists_evaluation(
         self, repository: MockEvaluationRepository, sample_evaluation: Evaluation
     ) -> None:
@@ -315,32 +303,20 @@ class TestEvaluationRepository:
         await repository.delete(sample_evaluation.evaluation_id)
         assert await repository.exists(sample_evaluation.evaluation_id) is False
 
-    @pytest.mark.asyncio
+    @_SHARED_LOOP
     async def test_list_all_evaluations(
-        self, repository: MockEvaluationRepository
+        self,
+        repository: MockEvaluationRepository,
+        sample_evaluation: Evaluation,
     ) -> None:
         """Test listing all evaluations."""
-        agent_config = AgentConfig(
-            agent_type="none",
-            model_provider="openai",
-            model_name="gpt-4",
-            model_parameters={},
-            agent_parameters={},
-        )
-
         # Create multiple evaluations
         evaluations = []
         for _ in range(5):
-            evaluation = Evaluation(
+            evaluation = replace(
+                sample_evaluation,
                 evaluation_id=uuid.uuid4(),
-                agent_config=agent_config,
                 preprocessed_benchmark_id=uuid.uuid4(),
-                status="pending",
-                created_at=datetime.now(),
-                started_at=None,
-                completed_at=None,
-                results=None,
-                failure_reason=None,
             )
             evaluations.append(evaluation)
             await repository.save(evaluation)
@@ -357,8 +333,7 @@ class TestEvaluationRepository:
         for evaluation in limited_evals:
             assert evaluation in evaluations
 
-    @pytest.mark.asyncio
-    async def test_abstract_interface_compliance(self) -> None:
+    def test_abstract_interface_compliance(self) -> None:
         """Test that EvaluationRepository is properly abstract."""
         # Should not be able to instantiate abstract class directly
         with pytest.raises(TypeError):
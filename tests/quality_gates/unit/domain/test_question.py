@@ -178,3 +178,13 @@ class TestQuestion:
         """Test that empty expected_answer raises ValueError."""
         with pytest.raises(ValueError, match="expected_answer cannot be empty"):
             Question(id="q1", text="Valid text", expected_answer="", metadata={})
+
+    def test_question_uses_slots(self) -> None:
+        """Test that Question instances carry no per-instance __dict__."""
+        question = Question(
+            id="q1", text="Valid text", expected_answer="Valid answer", metadata={}
+        )
+
+        assert not hasattr(question, "__dict__")
+        with pytest.raises(AttributeError):
+            question.text = "Changed"  # type: ignore
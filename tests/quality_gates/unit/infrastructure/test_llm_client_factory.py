@@ -209,6 +209,14 @@ class TestStrategySelection:
         strategy = factory._select_optimal_strategy("gpt-3.5-turbo", "openai")
         assert strategy == "native"
 
+    def test_auto_strategy_selects_native_for_openrouter_gpt_models(self, factory):
+        """Test auto-selection of native strategy for json_schema capable models."""
+        strategy = factory._select_optimal_strategy("openai/gpt-4o", "openrouter")
+        assert strategy == "native"
+
+        strategy = factory._select_optimal_strategy("meta/llama-3", "openrouter")
+        assert strategy == "marvin"
+
     def test_auto_strategy_selects_marvin_for_anthropic(self, factory):
         """Test auto-selection of marvin strategy for Anthropic."""
         strategy = factory._select_optimal_strategy("claude-3-sonnet", "anthropic")
@@ -362,3 +370,20 @@ class TestEndToEndClientCreation:
 
         assert isinstance(client, MarvinParsingClient)
         assert isinstance(client.base_client, OpenAIClient)
+
+    def test_create_client_reuses_client_for_same_combination(self, factory):
+        """Test repeated calls return the cached client instance."""
+        first = factory.create_client("gpt-4", provider="openai", strategy="native")
+        second = factory.create_client("gpt-4", provider="openai", strategy="native")
+
+        assert first is second
+
+    def test_create_client_caches_per_strategy(self, factory):
+        """Test different strategies produce distinct cached clients."""
+        native = factory.create_client("gpt-4", provider="openai", strategy="native")
+        outlines = factory.create_client(
+            "gpt-4", provider="openai", strategy="outlines"
+        )
+
+        assert native is not outlines
+        assert isinstance(outlines, OutlinesParsingClient)
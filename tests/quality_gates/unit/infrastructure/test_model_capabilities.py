@@ -57,3 +57,42 @@ class TestModelCapabilitiesRegistry:
         assert (
             ModelCapabilitiesRegistry.supports_logprobs("custom/unknown-model") is False
         )
+
+    def test_supports_json_schema_response_format_for_openai_models(self):
+        """Test json_schema support detection for OpenAI models."""
+        assert (
+            ModelCapabilitiesRegistry.supports_json_schema_response_format("gpt-4o")
+            is True
+        )
+        assert (
+            ModelCapabilitiesRegistry.supports_json_schema_response_format(
+                "openai/gpt-3.5-turbo"
+            )
+            is True
+        )
+
+    def test_no_json_schema_response_format_for_other_models(self):
+        """Test json_schema support is not assumed for other models."""
+        assert (
+            ModelCapabilitiesRegistry.supports_json_schema_response_format(
+                "anthropic/claude-3-sonnet"
+            )
+            is False
+        )
+        assert (
+            ModelCapabilitiesRegistry.supports_json_schema_response_format(
+                "meta/llama-3.1-8b-instruct"
+            )
+            is False
+        )
+
+    def test_capability_lookups_are_memoized(self):
+        """Test repeated lookups for the same model hit the cache."""
+        ModelCapabilitiesRegistry.supports_logprobs.cache_clear()
+
+        ModelCapabilitiesRegistry.supports_logprobs("openai/gpt-4o")
+        ModelCapabilitiesRegistry.supports_logprobs("openai/gpt-4o")
+
+        cache_info = ModelCapabilitiesRegistry.supports_logprobs.cache_info()
+        assert cache_info.hits == 1
+        assert cache_info.misses == 1
@@ -15,6 +15,9 @@ import pytest
 from ml_agents_v2.core.domain.services.llm_client import LLMClient
 from ml_agents_v2.core.domain.value_objects.answer import ParsedResponse
 from ml_agents_v2.infrastructure.providers import OpenRouterClient
+from ml_agents_v2.infrastructure.providers.openrouter.client import (
+    OPENROUTER_ATTRIBUTION_HEADERS,
+)
 
 
 class MockCompletionUsage:
@@ -157,6 +160,27 @@ class TestOpenRouterACLIntegration:
             assert result.content == "Dict response"
             assert result.structured_data is None
 
+    async def test_each_request_gets_its_own_attribution_headers(self):
+        """Test a request changing its headers cannot alter later requests."""
+        mock_response = MockChatCompletion(
+            choices=[MockChoice(message=MockChatCompletionMessage(content="ok"))]
+        )
+        client = OpenRouterClient(api_key="test-key")
+
+        with patch.object(
+            client._client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.return_value = mock_response
+            messages = [{"role": "user", "content": "test"}]
+
+            await client.chat_completion(model="gpt-4", messages=messages)
+            mock_create.call_args.kwargs["extra_headers"]["X-Title"] = "changed"
+            await client.chat_completion(model="gpt-4", messages=messages)
+
+            headers = mock_create.call_args.kwargs["extra_headers"]
+            assert headers == dict(OPENROUTER_ATTRIBUTION_HEADERS)
+            assert OPENROUTER_ATTRIBUTION_HEADERS["X-Title"] == "ML-Agents-v2"
+
     async def test_no_external_types_leak_to_domain(self):
         """Test that no external API types leak into domain layer."""
         # This is a meta-test ensuring our ACL boundary is effective
@@ -0,0 +1,52 @@
+"""Tests for infrastructure structured output models."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ml_agents_v2.core.domain.services.llm_client import LLMClient
+from ml_agents_v2.infrastructure.models.models import (
+    AGENT_OUTPUT_SCHEMAS,
+    ChainOfThoughtOutput,
+    DirectAnswerOutput,
+)
+from ml_agents_v2.infrastructure.parsers import NativeParsingClient
+
+
+class TestOutputSchemaRegistration:
+    """Test schemas registered on output models at class creation."""
+
+    @pytest.mark.parametrize("model", [DirectAnswerOutput, ChainOfThoughtOutput])
+    def test_response_format_wraps_pydantic_schema(self, model):
+        """Test the response_format embeds the pydantic-generated schema."""
+        response_format = model.response_format()
+        json_schema = response_format["json_schema"]
+
+        assert response_format["type"] == "json_schema"
+        assert json_schema["name"] == model.__name__.lower()
+        assert json_schema["schema"] == model.model_json_schema()
+        assert json_schema["strict"] is True
+
+    @pytest.mark.parametrize("model", [DirectAnswerOutput, ChainOfThoughtOutput])
+    def test_registered_payloads_are_read_only(self, model):
+        """Test the shared class-level schema and response_format reject writes."""
+        with pytest.raises(TypeError):
+            model.RESPONSE_FORMAT["json_schema"]["strict"] = False  # type: ignore[index]
+        with pytest.raises(TypeError):
+            model.JSON_SCHEMA["properties"]["answer"]["type"] = "integer"  # type: ignore[index]
+
+    def test_every_agent_output_schema_is_registered(self):
+        """Test all agent output models carry a registered response_format."""
+        for model in AGENT_OUTPUT_SCHEMAS.values():
+            assert "RESPONSE_FORMAT" in vars(model)
+
+    def test_response_format_is_fresh_per_request(self):
+        """Test changes to one request's response_format do not leak into the next."""
+        client = NativeParsingClient(Mock(spec=LLMClient))
+
+        first = client._create_response_format(ChainOfThoughtOutput)
+        first["json_schema"]["schema"]["required"].append("extra")
+        second = client._create_response_format(ChainOfThoughtOutput)
+
+        assert second == ChainOfThoughtOutput.response_format()
+        assert "extra" not in second["json_schema"]["schema"]["required"]
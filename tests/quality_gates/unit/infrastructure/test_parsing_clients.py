@@ -0,0 +1,51 @@
+"""Tests for structured output parsing client wrappers."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from ml_agents_v2.core.domain.services.llm_client import LLMClient
+from ml_agents_v2.core.domain.value_objects.answer import ParsedResponse
+from ml_agents_v2.infrastructure.parsers import OutlinesParsingClient
+
+
+class TestOutlinesContentFallback:
+    """Test Outlines fallback parsing when structured_data is missing."""
+
+    @pytest.fixture
+    def base_client(self):
+        """Create base client mock; the spec makes chat_completion async."""
+        return Mock(spec=LLMClient)
+
+    async def test_valid_json_content_is_parsed(self, base_client):
+        """Test JSON content matching the schema becomes structured_data."""
+        base_client.chat_completion.return_value = ParsedResponse(
+            content='{"answer": "Paris"}'
+        )
+        client = OutlinesParsingClient(base_client)
+
+        response = await client.chat_completion(
+            "gpt-4", [{"role": "user", "content": "q"}], _internal_agent_type="none"
+        )
+
+        assert response.structured_data == {"answer": "Paris"}
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json at all", '{"reasoning": "missing answer"}'],
+        ids=["invalid_json", "schema_mismatch"],
+    )
+    async def test_unparseable_content_returns_response_unchanged(
+        self, base_client, content
+    ):
+        """Test JSON decode and validation failures return the raw response."""
+        raw_response = ParsedResponse(content=content)
+        base_client.chat_completion.return_value = raw_response
+        client = OutlinesParsingClient(base_client)
+
+        response = await client.chat_completion(
+            "gpt-4", [{"role": "user", "content": "q"}], _internal_agent_type="none"
+        )
+
+        assert response is raw_response
+        assert not response.has_structured_data()